@@ -6,9 +6,10 @@ checking for orphaned records, missing media files, and other data issues.
 
 import argparse
 import logging
+import os
 from pathlib import Path
 
-from sqlalchemy import create_engine, select
+from sqlalchemy import create_engine, func, select
 from sqlalchemy.orm import sessionmaker
 
 from doughub.config import DATABASE_URL, MEDIA_ROOT
@@ -21,133 +22,152 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 
-def check_orphaned_media(session) -> list[str]:
-    """Check for media records with missing question references.
+def _collect_disk_paths(root: Path) -> set[str]:
+    """Collect all file paths under a directory in a single traversal.
 
-    Args:
-        session: Database session.
-
-    Returns:
-        List of error messages for orphaned media.
-    """
-    errors = []
-    stmt = select(Media)
-    media_records = session.execute(stmt).scalars().all()
-
-    for media in media_records:
-        stmt = select(Question).where(Question.question_id == media.question_id)
-        question = session.execute(stmt).scalar_one_or_none()
-        if question is None:
-            errors.append(
-                f"Orphaned media: media_id={media.media_id}, "
-                f"question_id={media.question_id}, path={media.relative_path}"
-            )
-
-    return errors
-
-
-def check_missing_media_files(session) -> list[str]:
-    """Check for media records pointing to non-existent files.
+    Symlinked files and directories are followed, like Path.exists() does.
+    Each directory is visited once, so symlink cycles cannot loop forever.
 
     Args:
-        session: Database session.
+        root: Directory to walk.
 
     Returns:
-        List of error messages for missing files.
+        Set of posix-style paths relative to root.
     """
-    errors = []
-    media_root = Path(MEDIA_ROOT)
-    stmt = select(Media)
-    media_records = session.execute(stmt).scalars().all()
-
-    for media in media_records:
-        file_path = media_root / media.relative_path
-        if not file_path.exists():
-            errors.append(
-                f"Missing file: media_id={media.media_id}, "
-                f"path={media.relative_path}, full_path={file_path}"
-            )
-
-    return errors
-
-
-def check_orphaned_questions(session) -> list[str]:
-    """Check for questions with invalid source references.
+    paths: set[str] = set()
+    if not root.is_dir():
+        return paths
+
+    visited: set[tuple[int, int]] = set()
+    stack = [str(root)]
+    while stack:
+        current = stack.pop()
+        try:
+            stat = os.stat(current)
+            with os.scandir(current) as it:
+                entries = list(it)
+        except OSError:
+            continue
+        if (stat.st_dev, stat.st_ino) in visited:
+            continue
+        visited.add((stat.st_dev, stat.st_ino))
+
+        for entry in entries:
+            if entry.is_dir():
+                stack.append(entry.path)
+            elif entry.is_file():
+                rel_path = os.path.relpath(entry.path, root)
+                paths.add(rel_path.replace(os.sep, "/"))
+
+    return paths
+
+
+def scan_media(session, media_root: Path) -> list[str]:
+    """Check media records in a single pass over the media table.
+
+    Detects media whose question no longer exists (via LEFT OUTER JOIN) and
+    media whose file is missing under media_root (via one directory walk,
+    falling back to a filesystem check for paths the walk did not list).
 
     Args:
         session: Database session.
+        media_root: Root directory containing media files.
 
     Returns:
-        List of error messages for orphaned questions.
+        List of error messages, orphaned media first, then missing files.
     """
-    errors = []
-    stmt = select(Question)
-    questions = session.execute(stmt).scalars().all()
-
-    for question in questions:
-        stmt = select(Source).where(Source.source_id == question.source_id)
-        source = session.execute(stmt).scalar_one_or_none()
-        if source is None:
-            errors.append(
-                f"Orphaned question: question_id={question.question_id}, "
-                f"source_id={question.source_id}, key={question.source_question_key}"
+    orphaned = []
+    missing = []
+    disk_paths = _collect_disk_paths(media_root)
+    stmt = (
+        select(
+            Media.media_id,
+            Media.question_id,
+            Media.relative_path,
+            Question.question_id.is_(None),
+        )
+        .outerjoin(Question, Question.question_id == Media.question_id)
+        .execution_options(yield_per=10_000)
+    )
+
+    for media_id, question_id, relative_path, is_orphan in session.execute(stmt):
+        if is_orphan:
+            orphaned.append(
+                f"Orphaned media: media_id={media_id}, "
+                f"question_id={question_id}, path={relative_path}"
+            )
+        # Paths not found verbatim (e.g. with ".." segments or differing
+        # case on case-insensitive filesystems) are checked directly
+        if (
+            Path(relative_path).as_posix() not in disk_paths
+            and not (media_root / relative_path).exists()
+        ):
+            missing.append(
+                f"Missing file: media_id={media_id}, "
+                f"path={relative_path}, full_path={media_root / relative_path}"
             )
 
-    return errors
+    return orphaned + missing
 
 
-def check_duplicate_questions(session) -> list[str]:
-    """Check for duplicate (source_id, source_question_key) pairs.
+def scan_questions(session) -> tuple[list[str], list[str]]:
+    """Check question records in a single pass over the questions table.
+
+    Detects questions with invalid source references (via LEFT OUTER JOIN),
+    duplicate (source_id, source_question_key) pairs, and empty required
+    fields. Rows are streamed in batches so large databases are not loaded
+    into memory all at once.
 
     Args:
         session: Database session.
 
     Returns:
-        List of warning messages for duplicates.
+        Tuple of (errors, warnings). Errors list orphaned questions before
+        empty-field problems; warnings report duplicate keys.
     """
+    orphaned = []
+    empty_fields = []
     warnings = []
-    stmt = select(Question)
-    questions = session.execute(stmt).scalars().all()
-
     seen = set()
-    for question in questions:
-        key = (question.source_id, question.source_question_key)
-        if key in seen:
-            warnings.append(
-                f"Duplicate question key: source_id={question.source_id}, "
-                f"key={question.source_question_key}"
-            )
-        seen.add(key)
-
-    return warnings
+    stmt = (
+        select(
+            Question.question_id,
+            Question.source_id,
+            Question.source_question_key,
+            Question.raw_html,
+            Question.raw_metadata_json,
+            Source.source_id.is_(None),
+        )
+        .outerjoin(Source, Source.source_id == Question.source_id)
+        .execution_options(yield_per=10_000)
+    )
 
+    for (
+        question_id,
+        source_id,
+        key,
+        raw_html,
+        raw_metadata_json,
+        is_orphan,
+    ) in session.execute(stmt):
+        if is_orphan:
+            orphaned.append(
+                f"Orphaned question: question_id={question_id}, "
+                f"source_id={source_id}, key={key}"
+            )
 
-def check_empty_required_fields(session) -> list[str]:
-    """Check for questions with empty required fields.
+        if (source_id, key) in seen:
+            warnings.append(f"Duplicate question key: source_id={source_id}, key={key}")
+        seen.add((source_id, key))
 
-    Args:
-        session: Database session.
-
-    Returns:
-        List of error messages for invalid data.
-    """
-    errors = []
-    stmt = select(Question)
-    questions = session.execute(stmt).scalars().all()
-
-    for question in questions:
-        if not question.raw_html or not question.raw_html.strip():
-            errors.append(
-                f"Empty raw_html: question_id={question.question_id}, "
-                f"key={question.source_question_key}"
-            )
-        if not question.raw_metadata_json or not question.raw_metadata_json.strip():
-            errors.append(
-                f"Empty raw_metadata_json: question_id={question.question_id}, "
-                f"key={question.source_question_key}"
+        if not raw_html or not raw_html.strip():
+            empty_fields.append(f"Empty raw_html: question_id={question_id}, key={key}")
+        if not raw_metadata_json or not raw_metadata_json.strip():
+            empty_fields.append(
+                f"Empty raw_metadata_json: question_id={question_id}, key={key}"
             )
 
-    return errors
+    return orphaned + empty_fields, warnings
 
 
 def print_summary(
@@ -211,11 +231,6 @@ def main() -> None:
     logger.info(f"Checking database: {args.database_url}")
     logger.info(f"Media root: {args.media_root}")
 
-    # Override config if provided
-    if args.media_root != MEDIA_ROOT:
-        import doughub.config as config
-        config.MEDIA_ROOT = args.media_root
-
     # Connect to database (read-only)
     engine = create_engine(args.database_url, echo=False)
 
@@ -227,34 +242,27 @@ def main() -> None:
 
     try:
         # Gather statistics
-        sources_count = session.execute(select(Source)).scalars().all()
-        questions_count = session.execute(select(Question)).scalars().all()
-        media_count = session.execute(select(Media)).scalars().all()
+        sources_count = session.scalar(select(func.count()).select_from(Source))
+        questions_count = session.scalar(select(func.count()).select_from(Question))
+        media_count = session.scalar(select(func.count()).select_from(Media))
 
         # Run checks
         all_errors = []
         all_warnings = []
 
-        logger.info("Checking for orphaned media...")
-        all_errors.extend(check_orphaned_media(session))
-
-        logger.info("Checking for missing media files...")
-        all_errors.extend(check_missing_media_files(session))
-
-        logger.info("Checking for orphaned questions...")
-        all_errors.extend(check_orphaned_questions(session))
-
-        logger.info("Checking for duplicate questions...")
-        all_warnings.extend(check_duplicate_questions(session))
+        logger.info("Checking media records and files...")
+        all_errors.extend(scan_media(session, Path(args.media_root)))
 
-        logger.info("Checking for empty required fields...")
-        all_errors.extend(check_empty_required_fields(session))
+        logger.info("Checking question records...")
+        question_errors, question_warnings = scan_questions(session)
+        all_errors.extend(question_errors)
+        all_warnings.extend(question_warnings)
 
         # Print summary
         print_summary(
-            len(sources_count),
-            len(questions_count),
-            len(media_count),
+            sources_count or 0,
+            questions_count or 0,
+            media_count or 0,
             all_errors,
             all_warnings,
         )
@@ -6,39 +6,194 @@ Displays the received data in the terminal for debugging.
 Now includes automatic persistence to the SQLite database.
 """
 
+import atexit
+import itertools
 import json
+import logging
+import os
+import shutil
 import sys
+import threading
 import urllib.parse
-import urllib.request
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import datetime, timedelta
 from pathlib import Path
 
+import httpx
 from flask import Flask, jsonify, request
+from flask.json.provider import DefaultJSONProvider
 from flask_cors import CORS
 from sqlalchemy import and_, create_engine
 from sqlalchemy.orm import sessionmaker
+from werkzeug.exceptions import RequestEntityTooLarge
 
 from doughub.config import DATABASE_URL, MEDIA_ROOT
 from doughub.models import Base, Question
 from doughub.persistence import QuestionRepository
 
+try:
+    import orjson
+except ImportError:  # Optional speedup, fall back to the stdlib
+    orjson = None
+
+logging.basicConfig(
+    level=logging.INFO,
+    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+)
+logger = logging.getLogger(__name__)
+
+# Largest accepted /extract request body, in bytes
+MAX_EXTRACTION_BYTES = int(os.getenv("MAX_EXTRACTION_BYTES", str(50 * 1024 * 1024)))
+
+
+class OrjsonProvider(DefaultJSONProvider):
+    """Flask JSON provider that serializes responses with orjson."""
+
+    def dumps(self, obj, **kwargs) -> str:
+        return orjson.dumps(obj, default=self.default).decode("utf-8")
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
+
 app = Flask(__name__)
+if orjson is not None:
+    app.json = OrjsonProvider(app)
+app.config["MAX_CONTENT_LENGTH"] = MAX_EXTRACTION_BYTES
 CORS(app)  # Enable CORS for all routes
 
-# Store extractions for review
-extractions = []
+# Recent extraction summaries for review. Only lightweight metadata and the
+# saved file paths are kept; full payloads are re-read from disk on demand.
+EXTRACTION_BUFFER_SIZE = int(os.getenv("EXTRACTION_BUFFER_SIZE", "256"))
+extractions: deque[dict] = deque(maxlen=EXTRACTION_BUFFER_SIZE)
+extraction_counter = itertools.count()
+# Shared copies of strings that repeat across summaries (site and host names)
+_string_pool: dict[str, str] = {}
+# Guards extractions when requests are served on multiple threads
+extractions_lock = threading.Lock()
+
+# Pre-built summary logged once per received extraction
+EXTRACTION_RECEIVED_TEMPLATE = (
+    "Extraction received at %s\n"
+    "  URL:      %s\n"
+    "  Site:     %s\n"
+    "  Elements: %s\n"
+    "  Images:   %s\n"
+    "  Size:     %.1f KB\n"
+    "  HTML:     %s\n"
+    "  JSON:     %s"
+)
 
 # Create output directory for saved extractions
 OUTPUT_DIR = Path(__file__).parent.parent / "extractions"
 OUTPUT_DIR.mkdir(exist_ok=True)
 
+# Background writer so extraction file I/O overlaps with image downloads
+file_writer = ThreadPoolExecutor(max_workers=4, thread_name_prefix="extract-writer")
+atexit.register(file_writer.shutdown, wait=True)
+
+# Shared pool for fetching extraction images concurrently
+image_downloader = ThreadPoolExecutor(max_workers=8, thread_name_prefix="image-download")
+atexit.register(image_downloader.shutdown, wait=False)
+
+# Shared HTTP client so image downloads reuse keep-alive connections per host
+http_client = httpx.Client(
+    follow_redirects=True,
+    timeout=30.0,
+    limits=httpx.Limits(max_connections=16, max_keepalive_connections=8),
+)
+atexit.register(http_client.close)
+
+# Chunk size used when streaming image downloads to disk
+DOWNLOAD_CHUNK_SIZE = 64 * 1024
+
+# Buffer size for output files, so writes reach the OS in large blocks
+WRITE_BUFFER_SIZE = 1 << 20
+
 # Initialize database connection
 engine = create_engine(DATABASE_URL)
 Base.metadata.create_all(engine)
 SessionLocal = sessionmaker(bind=engine)
 
 # Ensure media root exists
-Path(MEDIA_ROOT).mkdir(parents=True, exist_ok=True)
+MEDIA_ROOT_DIR = Path(MEDIA_ROOT)
+MEDIA_ROOT_DIR.mkdir(parents=True, exist_ok=True)
+
+# MIME types for downloaded images, keyed by lowercase file extension
+IMAGE_MIME_TYPES = {
+    ".jpg": "image/jpeg",
+    ".jpeg": "image/jpeg",
+    ".png": "image/png",
+    ".gif": "image/gif",
+    ".webp": "image/webp",
+}
+
+
+def _intern(value: str | None) -> str | None:
+    """Return a shared copy of a frequently repeated string."""
+    if value is None:
+        return None
+    return _string_pool.setdefault(value, value)
+
+
+def _loads(body: bytes):
+    """Decode a JSON request body, using orjson when available."""
+    if orjson is not None:
+        return orjson.loads(body)
+    return json.loads(body)
+
+
+def _dumps(obj) -> str:
+    """Encode an object as compact JSON text, using orjson when available."""
+    if orjson is not None:
+        return orjson.dumps(obj).decode("utf-8")
+    return json.dumps(obj)
+
+
+def _dumps_indented(obj) -> bytes:
+    """Encode an object as indented UTF-8 JSON, using orjson when available."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    return json.dumps(obj, indent=2).encode("utf-8")
+
+
+def _write_file(path: Path, payload: bytes) -> None:
+    """Write a payload in a single buffered call and move it into place.
+
+    The payload is written to a temporary file next to the destination and
+    renamed over it, so readers never see a partially written file.
+
+    Args:
+        path: Destination file path
+        payload: Bytes to write
+    """
+    tmp_path = path.with_name(f"{path.name}.tmp")
+    with open(tmp_path, "wb", buffering=WRITE_BUFFER_SIZE) as f:
+        f.write(payload)
+        f.flush()
+    os.replace(tmp_path, path)
+
+
+def _write_in_background(path: Path, payload: bytes) -> Future:
+    """Queue a file write on the background writer pool.
+
+    Args:
+        path: Destination file path
+        payload: Bytes to write
+
+    Returns:
+        Future for the pending write
+    """
+
+    def _report_failure(future: Future) -> None:
+        error = future.exception()
+        if error is not None:
+            logger.error("Failed to write %s: %s", path, error)
+
+    future = file_writer.submit(_write_file, path, payload)
+    future.add_done_callback(_report_failure)
+    return future
 
 
 def parse_source_and_key(data: dict, base_filename: str) -> tuple[str, str]:
@@ -89,10 +244,9 @@ def copy_image_to_media_root(source_path: Path, source_name: str, question_key:
         Relative path to the copied file
     """
     source_path = Path(source_path)
-    media_root = Path(MEDIA_ROOT)
 
     # Create source-specific directory
-    source_dir = media_root / source_name
+    source_dir = MEDIA_ROOT_DIR / source_name
     source_dir.mkdir(parents=True, exist_ok=True)
 
     # Create destination filename
@@ -102,10 +256,8 @@ def copy_image_to_media_root(source_path: Path, source_name: str, question_key:
 
     # Copy file if source exists
     if source_path.exists():
-        import shutil
-
         shutil.copy2(source_path, dest_path)
-        print(f"   [DB] Copied to media_root: {source_name}/{dest_filename}")
+        logger.debug("Copied to media_root: %s/%s", source_name, dest_filename)
 
     # Return relative path
     return f"{source_name}/{dest_filename}"
@@ -128,15 +280,22 @@ def _group_question_automatically(new_question: Question, session):
 
     if potential_parent:
         new_question.parent_id = potential_parent.question_id
-        print(f"[DB] Automatically grouped question {new_question.question_id} under parent {potential_parent.question_id}")
+        logger.info(
+            "Automatically grouped question %s under parent %s",
+            new_question.question_id,
+            potential_parent.question_id,
+        )
 
 
-def persist_to_database(data: dict, html_file: Path, json_file: Path, downloaded_images: list, base_filename: str) -> tuple[bool, str | None]:
+def persist_to_database(data: dict, json_data: dict, json_file: Path, downloaded_images: list, base_filename: str) -> tuple[bool, str | None]:
     """Persist the extraction to the database.
 
+    Uses the in-memory request payload rather than reading the just-written
+    extraction files back from disk.
+
     Args:
         data: Extraction data dictionary
-        html_file: Path to saved HTML file
+        json_data: Metadata dictionary that was saved to the JSON file
         json_file: Path to saved JSON file
         downloaded_images: List of downloaded image metadata
         base_filename: Base filename for the extraction
@@ -152,7 +311,7 @@ def persist_to_database(data: dict, html_file: Path, json_file: Path, downloaded
         # Parse source name and question key
         source_name, question_key = parse_source_and_key(data, base_filename)
 
-        print(f"[DB] Persisting: {source_name}/{question_key}")
+        logger.debug("Persisting: %s/%s", source_name, question_key)
 
         # Get or create source
         source = repo.get_or_create_source(name=source_name)
@@ -161,25 +320,18 @@ def persist_to_database(data: dict, html_file: Path, json_file: Path, downloaded
         # Check if question already exists
         existing_question = repo.get_question_by_source_key(source_id, question_key)
         if existing_question:
-            print(
-                f"[DB] Question already exists in database: {source_name}/{question_key}"
+            logger.info(
+                "Question already exists in database: %s/%s", source_name, question_key
             )
             repo.commit()
             return True, None
 
-        # Read HTML content
-        html_content = html_file.read_text(encoding="utf-8")
-
-        # Prepare metadata JSON (the data we already saved)
-        with open(json_file, encoding="utf-8") as f:
-            metadata = json.load(f)
-
         # Create question data
         question_data = {
             "source_id": source_id,
             "source_question_key": question_key,
-            "raw_html": html_content,
-            "raw_metadata_json": json.dumps(metadata),
+            "raw_html": data.get("pageHTML", ""),
+            "raw_metadata_json": _dumps(json_data),
             "status": "extracted",
             "extraction_path": str(json_file.parent / json_file.stem),
         }
@@ -187,7 +339,7 @@ def persist_to_database(data: dict, html_file: Path, json_file: Path, downloaded
         # Add question to database
         question = repo.add_question(question_data)
         question_id: int = question.question_id  # type: ignore
-        print(f"[DB] Added question to database (ID: {question_id})")
+        logger.info("Added question to database (ID: %s)", question_id)
 
         # Attempt to group this new question automatically
         _group_question_automatically(question, session)
@@ -199,7 +351,7 @@ def persist_to_database(data: dict, html_file: Path, json_file: Path, downloaded
 
             local_path = Path(img_info["local_path"])
             if not local_path.exists():
-                print(f"[DB] Warning: Image file not found: {local_path}")
+                logger.warning("Image file not found: %s", local_path)
                 continue
 
             # Copy image to media_root
@@ -208,15 +360,9 @@ def persist_to_database(data: dict, html_file: Path, json_file: Path, downloaded
             )
 
             # Determine MIME type from extension
-            ext = local_path.suffix.lower()
-            mime_types = {
-                ".jpg": "image/jpeg",
-                ".jpeg": "image/jpeg",
-                ".png": "image/png",
-                ".gif": "image/gif",
-                ".webp": "image/webp",
-            }
-            mime_type = mime_types.get(ext, "application/octet-stream")
+            mime_type = IMAGE_MIME_TYPES.get(
+                local_path.suffix.lower(), "application/octet-stream"
+            )
 
             # Add media record
             media_data = {
@@ -227,74 +373,115 @@ def persist_to_database(data: dict, html_file: Path, json_file: Path, downloaded
             }
             media = repo.add_media_to_question(question_id, media_data)
             media_id: int = media.media_id  # type: ignore
-            print(f"[DB]   Added media (ID: {media_id}): {relative_path}")
+            logger.debug("Added media (ID: %s): %s", media_id, relative_path)
 
         # Commit the transaction
         repo.commit()
-        print("[DB] ✓ Successfully persisted to database")
         return True, None
 
     except Exception as e:
         if session:
             session.rollback()
         error_msg = f"Database persistence failed: {e}"
-        print(f"[DB] ✗ {error_msg}", file=sys.stderr)
+        logger.error(error_msg)
         return False, error_msg
     finally:
         if session:
             session.close()
 
 
-def download_images(images, base_filename):
-    """Download images from URLs and save locally.
+def _download_image(idx: int, img: dict, base_filename: str, total: int) -> dict | None:
+    """Download a single image and save it locally.
 
     Args:
-        images: List of image dictionaries with 'url', 'title', etc.
+        idx: Index of the image within the extraction
+        img: Image dictionary with 'url', 'title', etc.
         base_filename: Base filename for saving (without extension)
+        total: Total number of images in the extraction
 
     Returns:
-        List of dictionaries with local paths and metadata
+        Dictionary with the local path and metadata, an error entry if the
+        download failed, or None if the image has no URL
     """
-    downloaded = []
-
-    for idx, img in enumerate(images):
-        try:
-            url = img.get("url")
-            if not url:
-                continue
+    try:
+        url = img.get("url")
+        if not url:
+            return None
+
+        # Parse URL to get file extension
+        parsed = urllib.parse.urlparse(url)
+        path = parsed.path
+        ext = Path(path).suffix or ".jpg"  # Default to .jpg if no extension
+
+        # Generate filename: base_filename_img0.jpg, base_filename_img1.jpg, etc.
+        img_filename = f"{base_filename}_img{idx}{ext}"
+        img_path = OUTPUT_DIR / img_filename
+
+        # Download the image
+        logger.debug("Downloading image %d/%d: %s", idx + 1, total, url)
+        # Stream to disk so memory stays bounded regardless of image size
+        with http_client.stream("GET", url) as response:
+            response.raise_for_status()
+            with open(img_path, "wb", buffering=WRITE_BUFFER_SIZE) as f:
+                for chunk in response.iter_bytes(DOWNLOAD_CHUNK_SIZE):
+                    f.write(chunk)
+
+        logger.debug("Saved image: %s", img_filename)
+        return {
+            "index": idx,
+            "url": url,
+            "local_path": str(img_path),
+            "filename": img_filename,
+            "title": img.get("title", ""),
+            "type": img.get("type", "image"),
+        }
 
-            # Parse URL to get file extension
-            parsed = urllib.parse.urlparse(url)
-            path = parsed.path
-            ext = Path(path).suffix or ".jpg"  # Default to .jpg if no extension
+    except Exception as e:
+        logger.warning("Failed to download image %d: %s", idx, e)
+        return {"index": idx, "url": img.get("url", ""), "error": str(e)}
 
-            # Generate filename: base_filename_img0.jpg, base_filename_img1.jpg, etc.
-            img_filename = f"{base_filename}_img{idx}{ext}"
-            img_path = OUTPUT_DIR / img_filename
 
-            # Download the image
-            print(f"   Downloading image {idx + 1}/{len(images)}: {url}")
-            urllib.request.urlretrieve(url, img_path)
+def download_images(images, base_filename):
+    """Download images from URLs and save locally.
 
-            downloaded.append(
-                {
-                    "index": idx,
-                    "url": url,
-                    "local_path": str(img_path),
-                    "filename": img_filename,
-                    "title": img.get("title", ""),
-                    "type": img.get("type", "image"),
-                }
-            )
+    Downloads run concurrently on a shared thread pool and each distinct URL
+    is fetched only once; repeated URLs reuse the first download's file.
+    Results are returned in the original image order.
 
-            print(f"   [OK] Saved: {img_filename}")
+    Args:
+        images: List of image dictionaries with 'url', 'title', etc.
+        base_filename: Base filename for saving (without extension)
 
-        except Exception as e:
-            print(f"   [FAIL] Failed to download image {idx}: {e}")
-            downloaded.append(
-                {"index": idx, "url": img.get("url", ""), "error": str(e)}
+    Returns:
+        List of dictionaries with local paths and metadata
+    """
+    futures: dict[str, Future] = {}
+    for idx, img in enumerate(images):
+        url = img.get("url")
+        if url and url not in futures:
+            futures[url] = image_downloader.submit(
+                _download_image, idx, img, base_filename, len(images)
             )
 
+    downloaded = []
+    for idx, img in enumerate(images):
+        url = img.get("url")
+        if not url:
+            continue
+
+        result = futures[url].result()
+        if result["index"] != idx:
+            # Duplicate URL: point at the canonical download
+            result = {
+                **result,
+                "index": idx,
+                "title": img.get("title", ""),
+                "type": img.get("type", "image"),
+            }
+            if "error" in result:
+                result = {"index": idx, "url": url, "error": result["error"]}
+        downloaded.append(result)
+
     return downloaded
 
 
@@ -307,14 +494,23 @@ def receive_extraction():
         return "", 204
 
     try:
-        data = request.get_json()
+        # Reject oversized payloads before reading the body
+        if request.content_length and request.content_length > MAX_EXTRACTION_BYTES:
+            return jsonify({"error": "Payload too large"}), 413
+
+        try:
+            data = _loads(request.get_data(cache=False))
+        except RequestEntityTooLarge:
+            return jsonify({"error": "Payload too large"}), 413
+        except ValueError as e:
+            return jsonify({"error": f"Invalid JSON: {e}"}), 400
 
         if not data:
             return jsonify({"error": "No data received"}), 400
 
-        # Store the extraction
-        extractions.append(data)
-        extraction_index = len(extractions) - 1
+        # Reserve a unique index for this extraction
+        with extractions_lock:
+            extraction_index = next(extraction_counter)
 
         # Generate filename based on timestamp and site
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
@@ -323,13 +519,15 @@ def receive_extraction():
 
         # Save HTML to file
         html_file = OUTPUT_DIR / f"{base_filename}.html"
-        html_file.write_text(data.get("pageHTML", ""), encoding="utf-8")
+        html_write = _write_in_background(
+            html_file, data.get("pageHTML", "").encode("utf-8")
+        )
 
         # Download images if present
         downloaded_images = []
         images = data.get("images", [])
         if images:
-            print(f"\n[DOWNLOAD] Downloading {len(images)} image(s)...")
+            logger.info("Downloading %d image(s)...", len(images))
             downloaded_images = download_images(images, base_filename)
 
         # Save JSON metadata (without the full HTML to keep it readable)
@@ -345,57 +543,75 @@ def receive_extraction():
             "images": downloaded_images,
         }
         json_file = OUTPUT_DIR / f"{base_filename}.json"
-        json_file.write_text(json.dumps(json_data, indent=2), encoding="utf-8")
-
-        # Print to terminal with formatting
-        print("\n" + "=" * 80)
-        print(f"[NEW] EXTRACTION RECEIVED at {data.get('timestamp', 'unknown')}")
-        print("=" * 80)
-        print(f"[URL] {data.get('url', 'unknown')}")
-        print(f"[SITE] {data.get('siteName', 'unknown')}")
-        print(f"[ELEMENTS] {data.get('elementCount', 0)}")
-        print(f"[IMAGES] {data.get('imageCount', 0)}")
-        print(f"[SIZE] {len(data.get('pageHTML', '')) / 1024:.1f} KB")
-        print("=" * 80)
-
-        # Print file locations
-        print("\n[SAVED] Files saved:")
-        print(f"   HTML: {html_file}")
-        print(f"   JSON: {json_file}")
+        json_write = _write_in_background(json_file, _dumps_indented(json_data))
+
+        # The writes overlap with the image downloads above, but both files
+        # must be complete before the extraction is listed or acknowledged
+        try:
+            html_write.result()
+            json_write.result()
+        except OSError as e:
+            return jsonify({"error": f"Failed to save extraction files: {e}"}), 500
+
+        # Store a lightweight summary of the extraction
+        with extractions_lock:
+            extractions.append(
+                {
+                    "index": extraction_index,
+                    "timestamp": data.get("timestamp"),
+                    "url": data.get("url"),
+                    "hostname": _intern(data.get("hostname")),
+                    "siteName": _intern(data.get("siteName")),
+                    "elementCount": data.get("elementCount"),
+                    "imageCount": data.get("imageCount", 0),
+                    "html_path": str(html_file),
+                    "json_path": str(json_file),
+                }
+            )
+
+        logger.info(
+            EXTRACTION_RECEIVED_TEMPLATE,
+            data.get("timestamp", "unknown"),
+            data.get("url", "unknown"),
+            data.get("siteName", "unknown"),
+            data.get("elementCount", 0),
+            data.get("imageCount", 0),
+            len(data.get("pageHTML", "")) / 1024,
+            html_file,
+            json_file,
+        )
 
         # Persist to database
         db_success, db_error = persist_to_database(
-            data, html_file, json_file, downloaded_images, base_filename
+            data, json_data, json_file, downloaded_images, base_filename
         )
 
-        # Print body text preview
-        body_text = data.get("bodyText", "")
-        if body_text:
-            preview = body_text[:500].replace("\n", " ")
-            print(f"\n[PREVIEW] Body Text Preview:\n{preview}...")
-
-        # Print some interesting elements
-        elements = data.get("elements", [])
-        if elements:
-            print("\n[SAMPLE] Sample Elements (first 10):")
-            for i, elem in enumerate(elements[:10]):
+        # Verbose previews are only built when debug logging is enabled
+        if logger.isEnabledFor(logging.DEBUG):
+            body_text = data.get("bodyText", "")
+            if body_text:
+                preview = body_text[:500].replace("\n", " ")
+                logger.debug("Body text preview: %s...", preview)
+
+            for i, elem in enumerate(data.get("elements", [])[:10]):
                 if elem.get("text"):
-                    print(
-                        f"  {i + 1}. [{elem['tag']}] {elem['selector']}: {elem['text'][:60]}..."
+                    logger.debug(
+                        "Sample element %d. [%s] %s: %s...",
+                        i + 1,
+                        elem["tag"],
+                        elem["selector"],
+                        elem["text"][:60],
                     )
 
-        print("\n" + "=" * 80)
-        print(f"[OK] Total extractions received: {len(extractions)}")
-        print(f"[FILE] View HTML: {html_file.absolute()}")
         if db_success:
-            print("[DB] ✓ Persisted to database")
+            logger.info("Extraction %d persisted to database", extraction_index + 1)
         else:
-            print(f"[DB] ✗ Database error: {db_error}")
-        print("=" * 80 + "\n")
+            logger.error("Database error: %s", db_error)
 
         response_data = {
             "status": "success",
             "message": "Data received successfully",
+            "index": extraction_index,
             "extraction_count": len(extractions),
             "files": {
                 "html": str(html_file),
@@ -415,24 +631,29 @@ def receive_extraction():
         return jsonify(response_data), 200
 
     except Exception as e:
-        print(f"\n[ERROR] ERROR receiving extraction: {e}\n", file=sys.stderr)
+        logger.error("Error receiving extraction: %s", e)
         return jsonify({"error": str(e)}), 500
 
 
 @app.route("/extractions", methods=["GET"])
 def list_extractions():
     """List all received extractions."""
+    with extractions_lock:
+        summaries = list(extractions)
     return jsonify(
         {
-            "total": len(extractions),
+            "total": len(summaries),
             "extractions": [
                 {
-                    "timestamp": ext.get("timestamp"),
-                    "url": ext.get("url"),
-                    "siteName": ext.get("siteName"),
-                    "elementCount": ext.get("elementCount"),
+                    "index": ext["index"],
+                    "timestamp": ext["timestamp"],
+                    "url": ext["url"],
+                    "hostname": ext["hostname"],
+                    "siteName": ext["siteName"],
+                    "elementCount": ext["elementCount"],
+                    "imageCount": ext["imageCount"],
                 }
-                for ext in extractions
+                for ext in summaries
             ],
         }
     ), 200
@@ -440,17 +661,32 @@ def list_extractions():
 
 @app.route("/extractions/<int:index>", methods=["GET"])
 def get_extraction(index):
-    """Get a specific extraction by index."""
-    if 0 <= index < len(extractions):
-        return jsonify(extractions[index]), 200
-    return jsonify({"error": "Extraction not found"}), 404
+    """Get a specific extraction by index.
+
+    The index is the extraction's counter value, as returned by POST /extract
+    and listed by GET /extractions, and is also part of the saved filenames.
+    It stays stable when older summaries are evicted or cleared. The full
+    extraction is loaded from the saved JSON and HTML files.
+    """
+    with extractions_lock:
+        summary = next((ext for ext in extractions if ext["index"] == index), None)
+    if summary is None:
+        return jsonify({"error": "Extraction not found"}), 404
+
+    try:
+        extraction = _loads(Path(summary["json_path"]).read_bytes())
+        extraction["pageHTML"] = Path(summary["html_path"]).read_text(encoding="utf-8")
+    except (OSError, ValueError) as e:
+        return jsonify({"error": f"Extraction files not available: {e}"}), 404
+    return jsonify(extraction), 200
 
 
 @app.route("/clear", methods=["POST"])
 def clear_extractions():
     """Clear all stored extractions."""
-    extractions.clear()
-    print("\n[CLEAR] All extractions cleared\n")
+    with extractions_lock:
+        extractions.clear()
+    logger.info("All extractions cleared")
     return jsonify({"status": "success", "message": "All extractions cleared"}), 200
 
 
@@ -465,7 +701,7 @@ def index():
             "endpoints": {
                 "POST /extract": "Receive extraction from Tampermonkey",
                 "GET /extractions": "List all extractions",
-                "GET /extractions/<index>": "Get specific extraction",
+                "GET /extractions/<index>": "Get specific extraction by its index",
                 "POST /clear": "Clear all extractions",
             },
         }
@@ -482,7 +718,12 @@ def main():
     print("=" * 80 + "\n")
 
     try:
-        app.run(host="0.0.0.0", port=5000, debug=False, use_reloader=False)
+        # Threaded so a slow extraction (image downloads, DB write) does not
+        # block other requests. A pre-fork server is not used because the
+        # extraction store above lives in process memory.
+        app.run(
+            host="0.0.0.0", port=5000, debug=False, use_reloader=False, threaded=True
+        )
     except KeyboardInterrupt:
         print("\n\n[STOP] Server stopped by user\n")
     except Exception as e:
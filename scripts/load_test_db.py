@@ -10,11 +10,11 @@ import logging
 import random
 from datetime import datetime
 
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event, func, insert, select
 from sqlalchemy.orm import sessionmaker
 
 from doughub.config import DATABASE_URL
-from doughub.models import Base
+from doughub.models import Base, Media, Question
 from doughub.persistence import QuestionRepository
 
 logging.basicConfig(
@@ -23,29 +23,56 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Number of questions inserted per batch/transaction
+BATCH_SIZE = 1000
 
-def generate_synthetic_html(question_num: int) -> str:
-    """Generate synthetic HTML content for a question.
 
-    Args:
-        question_num: Question number for content generation.
+# Invariant pools and templates, built once rather than per generated row
+ANSWER_CHOICES = ["A", "B", "C", "D", "E"]
+DIFFICULTIES = ["easy", "medium", "hard"]
+TOPICS = ["cardiology", "pulmonology", "gastroenterology", "neurology"]
+STATUSES = ["extracted", "processed", "reviewed"]
+MEDIA_TYPES = ["question_image", "explanation_image"]
+MIME_TYPES = ["image/jpeg", "image/png", "image/gif"]
+REFERENCE_LISTS = [[f"Reference {i}" for i in range(n)] for n in range(1, 4)]
 
-    Returns:
-        HTML string.
-    """
-    choices = ["A", "B", "C", "D", "E"]
-    return f"""
+_CHOICE_ITEMS = "".join(
+    f"<li>{choice}. Option {choice}</li>" for choice in ANSWER_CHOICES
+)
+_HTML_TEMPLATE = f"""
     <div class="question">
-        <h3>Question {question_num}</h3>
+        <h3>Question {{question_num}}</h3>
         <p>This is synthetic question content for testing purposes.
         Consider the following clinical scenario...</p>
         <ul>
-            {''.join(f'<li>{choice}. Option {choice}</li>' for choice in choices)}
+            {_CHOICE_ITEMS}
         </ul>
     </div>
     """
 
 
+def _set_bulk_load_pragmas(dbapi_connection, connection_record) -> None:
+    """Relax SQLite durability settings for the duration of a bulk load."""
+    cursor = dbapi_connection.cursor()
+    cursor.execute("PRAGMA journal_mode=WAL")
+    cursor.execute("PRAGMA synchronous=NORMAL")
+    cursor.execute("PRAGMA temp_store=MEMORY")
+    cursor.execute("PRAGMA cache_size=-262144")
+    cursor.close()
+
+
+def generate_synthetic_html(question_num: int) -> str:
+    """Generate synthetic HTML content for a question.
+
+    Args:
+        question_num: Question number for content generation.
+
+    Returns:
+        HTML string.
+    """
+    return _HTML_TEMPLATE.replace("{question_num}", str(question_num))
+
+
 def generate_synthetic_metadata(question_num: int) -> dict:
     """Generate synthetic metadata for a question.
 
@@ -57,13 +84,11 @@ def generate_synthetic_metadata(question_num: int) -> dict:
     """
     return {
         "question_number": question_num,
-        "difficulty": random.choice(["easy", "medium", "hard"]),
-        "topic": random.choice(
-            ["cardiology", "pulmonology", "gastroenterology", "neurology"]
-        ),
-        "correct_answer": random.choice(["A", "B", "C", "D", "E"]),
+        "difficulty": random.choice(DIFFICULTIES),
+        "topic": random.choice(TOPICS),
+        "correct_answer": random.choice(ANSWER_CHOICES),
         "explanation": f"Explanation for question {question_num}",
-        "references": [f"Reference {i}" for i in range(random.randint(1, 3))],
+        "references": random.choice(REFERENCE_LISTS),
     }
 
 
@@ -84,7 +109,16 @@ def load_test_database(
         max_media_per_question: Maximum number of media files per question.
     """
     logger.info(f"Connecting to database: {database_url}")
-    engine = create_engine(database_url, echo=False)
+    # Single-threaded, single-session script: one pooled connection is enough
+    engine = create_engine(
+        database_url,
+        echo=False,
+        pool_size=1,
+        max_overflow=0,
+        pool_pre_ping=True,
+    )
+    if engine.dialect.name == "sqlite":
+        event.listen(engine, "connect", _set_bulk_load_pragmas)
 
     # Create schema if it doesn't exist
     Base.metadata.create_all(engine)
@@ -105,67 +139,103 @@ def load_test_database(
         repo.commit()
         logger.info(f"Created {len(sources)} sources")
 
-        # Create questions
+        # Create questions with Core bulk inserts. The database assigns the
+        # question IDs (so sequences stay in step on PostgreSQL) and returns
+        # them per batch for the media rows.
         logger.info(f"Creating {num_questions} questions...")
         questions_per_source = num_questions // num_sources
         question_count = 0
-
+        skipped_count = 0
+        question_rows: list[dict] = []
+        # Media rows for the pending batch, keyed by (source_id, question_key)
+        pending_media: dict[tuple[int, str], list[dict]] = {}
+        statuses = random.choices(STATUSES, k=questions_per_source * num_sources)
+
+        def flush_batch() -> None:
+            if question_rows:
+                inserted = session.execute(
+                    insert(Question).returning(
+                        Question.question_id,
+                        Question.source_id,
+                        Question.source_question_key,
+                    ),
+                    question_rows,
+                )
+                media_rows = [
+                    {**media, "question_id": question_id}
+                    for question_id, source_id, key in inserted
+                    for media in pending_media.get((source_id, key), ())
+                ]
+                if media_rows:
+                    session.execute(insert(Media), media_rows)
+            session.commit()
+            question_rows.clear()
+            pending_media.clear()
+
+        question_num = 0
         for source in sources:
+            # Keys loaded by a previous run are skipped, so re-running the
+            # loader against the same database is safe
+            existing_keys = set(
+                session.scalars(
+                    select(Question.source_question_key).where(
+                        Question.source_id == source.source_id
+                    )
+                )
+            )
             for i in range(questions_per_source):
                 question_key = f"Q{i:06d}"
-                question_data = {
-                    "source_id": source.source_id,
-                    "source_question_key": question_key,
-                    "raw_html": generate_synthetic_html(question_count),
-                    "raw_metadata_json": json.dumps(
-                        generate_synthetic_metadata(question_count)
-                    ),
-                    "status": random.choice(["extracted", "processed", "reviewed"]),
-                }
-
-                question = repo.add_question(question_data)
+                status = statuses[question_num]
+                question_num += 1
+                if question_key in existing_keys:
+                    skipped_count += 1
+                    continue
+
+                question_rows.append(
+                    {
+                        "source_id": source.source_id,
+                        "source_question_key": question_key,
+                        "raw_html": generate_synthetic_html(question_count),
+                        "raw_metadata_json": json.dumps(
+                            generate_synthetic_metadata(question_count)
+                        ),
+                        "status": status,
+                    }
+                )
 
                 # Add media with probability
                 if random.random() < media_probability:
                     num_media = random.randint(1, max_media_per_question)
-                    for media_idx in range(num_media):
-                        media_data = {
+                    pending_media[(source.source_id, question_key)] = [
+                        {
                             "media_role": "image",
-                            "media_type": random.choice(
-                                ["question_image", "explanation_image"]
-                            ),
-                            "mime_type": random.choice(
-                                ["image/jpeg", "image/png", "image/gif"]
-                            ),
+                            "media_type": random.choice(MEDIA_TYPES),
+                            "mime_type": random.choice(MIME_TYPES),
                             "relative_path": f"{source.name}/{question_key}_img{media_idx}.jpg",
                         }
-                        repo.add_media_to_question(question.question_id, media_data)
+                        for media_idx in range(num_media)
+                    ]
 
                 question_count += 1
 
-                # Commit in batches for performance
-                if question_count % 1000 == 0:
-                    repo.commit()
+                # Insert and commit in batches
+                if question_count % BATCH_SIZE == 0:
+                    flush_batch()
                     logger.info(f"  Created {question_count} questions...")
 
-        # Final commit
-        repo.commit()
+        # Final batch
+        flush_batch()
         logger.info(f"Successfully created {question_count} questions")
+        if skipped_count:
+            logger.info(f"Skipped {skipped_count} questions that already exist")
 
-        # Print statistics
-        all_questions = repo.get_all_questions()
+        # Print statistics using server-side counts
+        question_total = session.scalar(select(func.count()).select_from(Question))
+        media_total = session.scalar(select(func.count()).select_from(Media))
         logger.info("\nFinal Statistics:")
         logger.info(f"  Total sources: {len(sources)}")
-        logger.info(f"  Total questions: {len(all_questions)}")
-
-        # Count media
-        from sqlalchemy import select
-
-        from doughub.models import Media
-
-        stmt = select(Media)
-        media_count = len(session.execute(stmt).scalars().all())
-        logger.info(f"  Total media: {media_count}")
+        logger.info(f"  Total questions: {question_total}")
+        logger.info(f"  Total media: {media_total}")
 
     except Exception as e:
         logger.error(f"Error during load test: {e}", exc_info=True)
@@ -28,11 +28,15 @@ def main() -> int:
 
     report = run_preflight_checks()
 
-    print()
-    print("=" * 70)
-    print(f"Results: {len(report.checks)} checks performed")
-    print("=" * 70)
-    print()
+    # Build the report in memory and write it to stdout in one call
+    lines = [
+        "",
+        "=" * 70,
+        f"Results: {len(report.checks)} checks performed",
+        "=" * 70,
+        "",
+    ]
+    add = lines.append
 
     # Display all checks with status
     for check in report.checks:
@@ -43,36 +47,37 @@ def main() -> int:
         else:  # FATAL
             symbol = "❌"
 
-        print(f"{symbol} [{check.severity.value:5s}] {check.name:30s}")
-        print(f"         {check.message}")
-        print()
+        add(f"{symbol} [{check.severity.value:5s}] {check.name:30s}")
+        add(f"         {check.message}")
+        add("")
 
-    print("=" * 70)
+    add("=" * 70)
 
     # Determine exit code and final status
     if report.has_fatal:
-        print("❌ FATAL: Environment validation failed")
-        print(f"   {len(report.fatal_messages)} fatal error(s) detected")
-        print()
-        print("Fatal errors must be fixed before the application can run:")
+        add("❌ FATAL: Environment validation failed")
+        add(f"   {len(report.fatal_messages)} fatal error(s) detected")
+        add("")
+        add("Fatal errors must be fixed before the application can run:")
         for i, msg in enumerate(report.fatal_messages, 1):
-            print(f"  {i}. {msg}")
-        print()
-        return 1
+            add(f"  {i}. {msg}")
+        exit_code = 1
     elif report.warnings:
-        print("⚠  WARNING: Environment has non-critical issues")
-        print(f"   {len(report.warnings)} warning(s) detected")
-        print()
-        print("Application can run, but some features may be unavailable:")
+        add("⚠  WARNING: Environment has non-critical issues")
+        add(f"   {len(report.warnings)} warning(s) detected")
+        add("")
+        add("Application can run, but some features may be unavailable:")
         for i, msg in enumerate(report.warnings, 1):
-            print(f"  {i}. {msg}")
-        print()
-        return 2
+            add(f"  {i}. {msg}")
+        exit_code = 2
     else:
-        print("✓  SUCCESS: All validation checks passed")
-        print("   Environment is healthy and ready")
-        print()
-        return 0
+        add("✓  SUCCESS: All validation checks passed")
+        add("   Environment is healthy and ready")
+        exit_code = 0
+    add("")
+
+    sys.stdout.write("\n".join(lines) + "\n")
+    return exit_code
 
 
 if __name__ == "__main__":
@@ -5,13 +5,13 @@ by creating stub notes for questions in the database.
 """
 
 import logging
+from itertools import islice
 from pathlib import Path
 
-from sqlalchemy import create_engine
 from sqlalchemy.orm import sessionmaker
 
 from doughub.config import DATABASE_URL, NOTES_DIR
-from doughub.persistence import QuestionRepository
+from doughub.persistence import QuestionRepository, get_engine
 
 logging.basicConfig(
     level=logging.INFO,
@@ -23,7 +23,7 @@ logger = logging.getLogger(__name__)
 def test_note_creation() -> None:
     """Test creating notes for existing questions."""
     logger.info(f"Connecting to database: {DATABASE_URL}")
-    engine = create_engine(DATABASE_URL, echo=False)
+    engine = get_engine(DATABASE_URL)
 
     SessionLocal = sessionmaker(bind=engine)
     session = SessionLocal()
@@ -31,7 +31,7 @@ def test_note_creation() -> None:
 
     try:
         # Get a few questions to test with
-        questions = repo.get_all_questions()[:5]  # Test with first 5 questions
+        questions = repo.get_questions(limit=5)  # Test with first 5 questions
 
         if not questions:
             logger.warning("No questions found in database. Run load_test_db.py first.")
@@ -40,13 +40,17 @@ def test_note_creation() -> None:
         logger.info(f"Found {len(questions)} questions to test with")
         logger.info(f"Notes directory: {NOTES_DIR}")
 
+        # Create notes in one batch (idempotent - safe to call multiple times)
+        note_paths = repo.ensure_notes_for_questions(
+            [int(question.question_id) for question in questions]
+        )
+
         for question in questions:
             logger.info(f"\nProcessing question {question.question_id}:")
             logger.info(f"  Source: {question.source.name}")
             logger.info(f"  Key: {question.source_question_key}")
 
-            # Create note (idempotent - safe to call multiple times)
-            note_path = repo.ensure_note_for_question(int(question.question_id))  # type: ignore[arg-type]
+            note_path = note_paths.get(int(question.question_id))
 
             if note_path:
                 logger.info(f"  ✓ Note created/verified: {note_path}")
@@ -57,7 +61,7 @@ def test_note_creation() -> None:
 
                     # Show first few lines
                     with open(note_path, encoding="utf-8") as f:
-                        first_lines = "".join(f.readlines()[:10])
+                        first_lines = "".join(islice(f, 10))
                         logger.info(f"  Content preview:\n{first_lines}")
                 else:
                     logger.error(f"  ✗ File not found: {note_path}")
@@ -69,10 +73,12 @@ def test_note_creation() -> None:
         logger.info("\n✓ All notes created successfully")
 
         # Test idempotency - try creating again
-        logger.info("\nTesting idempotency (calling ensure_note_for_question again)...")
-        for question in questions:
-            note_path = repo.ensure_note_for_question(int(question.question_id))  # type: ignore[arg-type]
-            logger.info(f"  Question {question.question_id}: {note_path}")
+        logger.info("\nTesting idempotency (calling ensure_notes_for_questions again)...")
+        note_paths = repo.ensure_notes_for_questions(
+            [int(question.question_id) for question in questions]
+        )
+        for question_id, note_path in note_paths.items():
+            logger.info(f"  Question {question_id}: {note_path}")
 
         repo.commit()
         logger.info("✓ Idempotency test passed")
@@ -83,7 +89,6 @@ def test_note_creation() -> None:
         raise
     finally:
         session.close()
-        engine.dispose()
 
 
 if __name__ == "__main__":
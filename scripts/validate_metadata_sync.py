@@ -11,12 +11,13 @@ import logging
 import sys
 from pathlib import Path
 
-from sqlalchemy import create_engine
 from sqlalchemy.orm import sessionmaker
 
 from doughub import config
 from doughub.models import Base
+from doughub.notebook.io import write_note_file
 from doughub.notebook.sync import scan_and_parse_notes
+from doughub.persistence import get_engine
 from doughub.persistence.repository import QuestionRepository
 
 logging.basicConfig(
@@ -31,7 +32,7 @@ def main() -> int:
     logger.info("Starting Phase 3 metadata sync validation")
 
     # Initialize database
-    engine = create_engine(config.DATABASE_URL)
+    engine = get_engine(config.DATABASE_URL)
     Base.metadata.create_all(engine)
     Session = sessionmaker(bind=engine)
     session = Session()
@@ -69,11 +70,11 @@ state: review
 
 This is a test note created for validation purposes.
 """
-        note_path.write_text(note_content, encoding="utf-8")
+        write_note_file(note_path, note_content)
         logger.info(f"Created note file: {note_path}")
 
         # Update note_path in database
-        question.note_path = str(note_path)
+        repo.set_note_path(question.question_id, str(note_path))
         repo.commit()
 
         # Step 3: Check initial state
@@ -85,10 +86,8 @@ This is a test note created for validation purposes.
 
         # Step 4: Run sync
         logger.info("Step 4: Running metadata sync")
-        sync_count = 0
-        for metadata in scan_and_parse_notes(notes_dir):
-            if repo.update_question_from_metadata(metadata):
-                sync_count += 1
+        metas = list(scan_and_parse_notes(notes_dir))
+        sync_count = repo.bulk_update_from_metadata(metas)
         repo.commit()
         logger.info(f"  Synced {sync_count} question(s)")
 
@@ -6,19 +6,63 @@ the transport layer for HTTP communication and returns structured data.
 """
 
 import logging
+import re
+from concurrent.futures import ThreadPoolExecutor
+from itertools import chain
 from typing import Any
 
 from ..exceptions import (
     AnkiConnectAPIError,
+    AnkiConnectError,
     DeckNotFoundError,
     InvalidNoteError,
     ModelNotFoundError,
     NoteNotFoundError,
 )
-from .transport import AnkiConnectTransport
+from .transport import MAX_KEEPALIVE_CONNECTIONS, AnkiConnectTransport
 
 logger = logging.getLogger(__name__)
 
+# notesInfo lookups larger than this are split into concurrent requests
+NOTES_INFO_CHUNK_SIZE = 500
+# One worker per keep-alive connection, so concurrent lookups reuse sockets
+NOTES_INFO_MAX_WORKERS = MAX_KEEPALIVE_CONNECTIONS
+
+# AnkiConnect error messages mapped to domain exceptions, checked in order
+_ERROR_PATTERNS: list[tuple[re.Pattern[str], type[AnkiConnectError]]] = [
+    (re.compile(r"deck was not found", re.IGNORECASE), DeckNotFoundError),
+    (re.compile(r"model was not found", re.IGNORECASE), ModelNotFoundError),
+    (
+        re.compile(r"note (?:was not found|does not exist)", re.IGNORECASE),
+        NoteNotFoundError,
+    ),
+    (
+        re.compile(r"cannot create note|cannot update|invalid", re.IGNORECASE),
+        InvalidNoteError,
+    ),
+]
+
+
+def _map_api_error(
+    error: AnkiConnectAPIError, messages: dict[type[AnkiConnectError], str]
+) -> AnkiConnectError | None:
+    """Translate an AnkiConnect API error into a domain exception.
+
+    Args:
+        error: The raw API error.
+        messages: Domain exception types that apply to the failed call,
+            mapped to the message to raise them with.
+
+    Returns:
+        The domain exception for the first matching pattern, or None if the
+        error should be re-raised unchanged.
+    """
+    text = str(error)
+    for pattern, exc_type in _ERROR_PATTERNS:
+        if exc_type in messages and pattern.search(text):
+            return exc_type(messages[exc_type])
+    return None
+
 
 class AnkiConnectAPI:
     """Typed wrapper around AnkiConnect API actions.
@@ -51,6 +95,23 @@ class AnkiConnectAPI:
         if self._owns_transport:
             self.transport.close()
 
+    def batch(self, calls: list[tuple[str, dict[str, Any]]]) -> list[Any]:
+        """Invoke several actions in a single request via AnkiConnect's `multi`.
+
+        Args:
+            calls: List of (action, params) pairs to invoke, in order.
+
+        Returns:
+            List of results, one per call, in the same order as `calls`.
+
+        Raises:
+            AnkiConnectConnectionError: If unable to connect.
+            AnkiConnectAPIError: If the request or any individual call fails.
+        """
+        return self.transport.invoke_multi(
+            [{"action": action, "params": params} for action, params in calls]
+        )
+
     def get_deck_names(self) -> list[str]:
         """Get a list of all deck names.
 
@@ -123,9 +184,12 @@ class AnkiConnectAPI:
             )
             return result
         except AnkiConnectAPIError as e:
-            if "model was not found" in str(e).lower():
-                raise ModelNotFoundError(f"Note type '{model_name}' not found") from e
-            raise
+            mapped = _map_api_error(
+                e, {ModelNotFoundError: f"Note type '{model_name}' not found"}
+            )
+            if mapped is None:
+                raise
+            raise mapped from e
 
     def get_model_fields_on_templates(self, model_name: str) -> dict[str, Any]:
         """Get field information including templates for a note type.
@@ -147,9 +211,12 @@ class AnkiConnectAPI:
             )
             return result
         except AnkiConnectAPIError as e:
-            if "model was not found" in str(e).lower():
-                raise ModelNotFoundError(f"Note type '{model_name}' not found") from e
-            raise
+            mapped = _map_api_error(
+                e, {ModelNotFoundError: f"Note type '{model_name}' not found"}
+            )
+            if mapped is None:
+                raise
+            raise mapped from e
 
     def find_note_ids(self, query: str) -> list[int]:
         """Find notes matching a search query.
@@ -183,10 +250,24 @@ class AnkiConnectAPI:
         if not note_ids:
             return []
 
-        result: list[dict[str, Any]] = self.transport.invoke(
-            "notesInfo", {"notes": note_ids}
-        )
-        return result
+        if len(note_ids) <= NOTES_INFO_CHUNK_SIZE:
+            result: list[dict[str, Any]] = self.transport.invoke(
+                "notesInfo", {"notes": note_ids}
+            )
+            return result
+
+        # Large lookups are split into chunks fetched concurrently; results
+        # are reassembled in the original order
+        chunks = [
+            note_ids[i : i + NOTES_INFO_CHUNK_SIZE]
+            for i in range(0, len(note_ids), NOTES_INFO_CHUNK_SIZE)
+        ]
+        with ThreadPoolExecutor(max_workers=NOTES_INFO_MAX_WORKERS) as executor:
+            parts = executor.map(
+                lambda chunk: self.transport.invoke("notesInfo", {"notes": chunk}),
+                chunks,
+            )
+            return list(chain.from_iterable(parts))
 
     def add_note(
         self,
@@ -227,16 +308,54 @@ class AnkiConnectAPI:
             )
             return result
         except AnkiConnectAPIError as e:
-            error_msg = str(e).lower()
-            if "deck was not found" in error_msg:
-                raise DeckNotFoundError(f"Deck '{deck_name}' not found") from e
-            if "model was not found" in error_msg:
-                raise ModelNotFoundError(f"Note type '{model_name}' not found") from e
-            if "cannot create note" in error_msg or "invalid" in error_msg:
-                raise InvalidNoteError(
-                    f"Invalid note data for model '{model_name}': {e}"
-                ) from e
-            raise
+            mapped = _map_api_error(
+                e,
+                {
+                    DeckNotFoundError: f"Deck '{deck_name}' not found",
+                    ModelNotFoundError: f"Note type '{model_name}' not found",
+                    InvalidNoteError: f"Invalid note data for model '{model_name}': {e}",
+                },
+            )
+            if mapped is None:
+                raise
+            raise mapped from e
+
+    def add_notes(self, specs: list[dict[str, Any]]) -> list[int | None]:
+        """Add several notes to Anki in a single request.
+
+        Uses AnkiConnect's batched `addNotes` action instead of one `addNote`
+        request per note.
+
+        Args:
+            specs: Note specifications, each with 'deck', 'model', 'fields'
+                and optional 'tags' keys.
+
+        Returns:
+            List of new note IDs in the same order as `specs`, with None for
+            notes Anki could not add.
+
+        Raises:
+            AnkiConnectConnectionError: If unable to connect.
+            AnkiConnectAPIError: If the API returns an error.
+        """
+        if not specs:
+            return []
+
+        notes = [
+            {
+                "deckName": spec["deck"],
+                "modelName": spec["model"],
+                "fields": spec["fields"],
+                "tags": spec.get("tags") or [],
+            }
+            for spec in specs
+        ]
+        result: list[int | None] = self.transport.invoke("addNotes", {"notes": notes})
+        logger.info(
+            f"Added {sum(1 for note_id in result if note_id is not None)} "
+            f"of {len(specs)} notes"
+        )
+        return result
 
     def update_note_fields(self, note_id: int, fields: dict[str, str]) -> None:
         """Update the fields of an existing note.
@@ -257,11 +376,58 @@ class AnkiConnectAPI:
             self.transport.invoke("updateNoteFields", {"note": note_data})
             logger.info(f"Updated fields for note {note_id}")
         except AnkiConnectAPIError as e:
-            error_msg = str(e).lower()
-            if "note was not found" in error_msg or "note does not exist" in error_msg:
-                raise NoteNotFoundError(f"Note {note_id} not found") from e
-            if "cannot update" in error_msg or "invalid" in error_msg:
-                raise InvalidNoteError(
-                    f"Invalid field data for note {note_id}: {e}"
-                ) from e
-            raise
+            mapped = _map_api_error(
+                e,
+                {
+                    NoteNotFoundError: f"Note {note_id} not found",
+                    InvalidNoteError: f"Invalid field data for note {note_id}: {e}",
+                },
+            )
+            if mapped is None:
+                raise
+            raise mapped from e
+
+    def update_note_fields_and_get_info(
+        self, note_id: int, fields: dict[str, str]
+    ) -> dict[str, Any]:
+        """Update a note's fields and read the note back in one request.
+
+        Args:
+            note_id: The ID of the note to update.
+            fields: Dictionary mapping field names to their new values.
+
+        Returns:
+            Raw notesInfo dictionary for the updated note.
+
+        Raises:
+            AnkiConnectConnectionError: If unable to connect.
+            AnkiConnectAPIError: If the API returns an error.
+            NoteNotFoundError: If the note does not exist.
+            InvalidNoteError: If the field data is invalid.
+        """
+        note_data = {"id": note_id, "fields": fields}
+
+        try:
+            _, notes_data = self.batch(
+                [
+                    ("updateNoteFields", {"note": note_data}),
+                    ("notesInfo", {"notes": [note_id]}),
+                ]
+            )
+            logger.info(f"Updated fields for note {note_id}")
+        except AnkiConnectAPIError as e:
+            mapped = _map_api_error(
+                e,
+                {
+                    NoteNotFoundError: f"Note {note_id} not found",
+                    InvalidNoteError: f"Invalid field data for note {note_id}: {e}",
+                },
+            )
+            if mapped is None:
+                raise
+            raise mapped from e
+
+        if not notes_data or not notes_data[0]:
+            raise NoteNotFoundError(f"Note {note_id} not found")
+        result: dict[str, Any] = notes_data[0]
+        return result
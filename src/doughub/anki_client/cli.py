@@ -5,11 +5,15 @@ allowing users to list decks, models, notes, and perform CRUD operations
 from the terminal.
 """
 
+import json
 import sys
+from itertools import chain
+from operator import attrgetter
 from typing import Any
 
 import click
 
+from ..models import Note
 from ..utils.anki_process import AnkiProcessManager
 from .repository import AnkiRepository
 
@@ -21,16 +25,36 @@ def cli(ctx: Any) -> None:
 
     Interact with Anki through AnkiConnect from the command line.
     """
-    # Store repository in context for subcommands
+    # The repository is created on first use (see _get_repository), so
+    # --help and launch-anki never open an AnkiConnect client
     ctx.ensure_object(dict)
-    ctx.obj["repository"] = AnkiRepository()
+
+
+def _get_repository(ctx: Any) -> AnkiRepository:
+    """Return the repository shared by all commands in this invocation.
+
+    The repository is created on first use and closed when the root context
+    ends, so nested ctx.invoke calls share one pooled connection.
+
+    Args:
+        ctx: The click context.
+
+    Returns:
+        The shared AnkiRepository.
+    """
+    repo: AnkiRepository | None = ctx.obj.get("repository")
+    if repo is None:
+        repo = AnkiRepository()
+        ctx.obj["repository"] = repo
+        ctx.find_root().call_on_close(repo.close)
+    return repo
 
 
 @cli.command("list-decks")
 @click.pass_context
 def list_decks(ctx: Any) -> None:
     """List all available decks."""
-    repo: AnkiRepository = ctx.obj["repository"]
+    repo = _get_repository(ctx)
 
     try:
         decks = repo.list_decks()
@@ -39,7 +63,7 @@ def list_decks(ctx: Any) -> None:
             return
 
         click.echo("Available decks:")
-        for deck in sorted(decks, key=lambda d: d.name):
+        for deck in sorted(decks, key=attrgetter("name")):
             click.echo(f"  {deck.name} (ID: {deck.id})")
     except Exception as e:
         click.echo(f"Error: {e}", err=True)
@@ -47,19 +71,28 @@ def list_decks(ctx: Any) -> None:
 
 
 @cli.command("list-models")
+@click.option(
+    "--fields/--no-fields",
+    "show_fields",
+    default=True,
+    help="Fetch and show the field count for each note type",
+)
 @click.pass_context
-def list_models(ctx: Any) -> None:
+def list_models(ctx: Any, show_fields: bool) -> None:
     """List all available note types (models)."""
-    repo: AnkiRepository = ctx.obj["repository"]
+    repo = _get_repository(ctx)
 
     try:
-        models = repo.list_models()
+        models = repo.list_models(include_fields=show_fields)
         if not models:
             click.echo("No note types found.")
             return
 
         click.echo("Available note types:")
-        for model in sorted(models, key=lambda m: m.name):
+        for model in sorted(models, key=attrgetter("name")):
+            if not show_fields:
+                click.echo(f"  {model.name} (ID: {model.id})")
+                continue
             field_count = len(model.fields) if model.fields else 0
             click.echo(f"  {model.name} (ID: {model.id}, {field_count} fields)")
     except Exception as e:
@@ -72,7 +105,7 @@ def list_models(ctx: Any) -> None:
 @click.pass_context
 def show_model_fields(ctx: Any, model: str) -> None:
     """Show field names for a note type."""
-    repo: AnkiRepository = ctx.obj["repository"]
+    repo = _get_repository(ctx)
 
     try:
         fields = repo.get_model_fields(model)
@@ -94,19 +127,23 @@ def show_model_fields(ctx: Any, model: str) -> None:
 @click.pass_context
 def list_notes(ctx: Any, deck: str, limit: int | None) -> None:
     """List notes in a deck."""
-    repo: AnkiRepository = ctx.obj["repository"]
+    repo = _get_repository(ctx)
 
     try:
-        notes = repo.list_notes_in_deck(deck, limit=limit)
-        if not notes:
+        # Stream notes so output starts before the whole deck is fetched
+        notes = repo.iter_notes_in_deck(deck, limit=limit)
+        first_note = next(notes, None)
+        if first_note is None:
             click.echo(f"No notes found in deck '{deck}'.")
             return
 
-        click.echo(f"Notes in '{deck}' ({len(notes)} found):")
+        click.echo(f"Notes in '{deck}':")
         click.echo(f"{'ID':<10} {'Model':<20} {'First Field'}")
         click.echo("-" * 70)
 
-        for note in notes:
+        count = 0
+        for note in chain([first_note], notes):
+            count += 1
             # Get first field value as preview
             first_field = ""
             if note.fields:
@@ -116,35 +153,77 @@ def list_notes(ctx: Any, deck: str, limit: int | None) -> None:
                     first_field = first_field[:37] + "..."
 
             click.echo(f"{note.note_id:<10} {note.model_name:<20} {first_field}")
+
+        click.echo(f"({count} found)")
     except Exception as e:
         click.echo(f"Error: {e}", err=True)
         sys.exit(1)
 
 
+def _parse_fields(field_args: tuple[str, ...]) -> dict[str, str]:
+    """Parse "FieldName=value" arguments into a field dictionary.
+
+    Exits with an error message if any argument has no "=".
+
+    Args:
+        field_args: Raw --field option values.
+
+    Returns:
+        Dictionary mapping stripped field names to stripped values.
+    """
+    field_dict: dict[str, str] = {}
+    for field_arg in field_args:
+        field_name, sep, field_value = field_arg.partition("=")
+        if not sep:
+            click.echo(
+                f"Error: Invalid field format '{field_arg}'. Expected 'FieldName=value'",
+                err=True,
+            )
+            sys.exit(1)
+        field_dict[field_name.strip()] = field_value.strip()
+    return field_dict
+
+
+def _print_note(note: Note) -> None:
+    """Print the details of a note.
+
+    Args:
+        note: The note to display.
+    """
+    click.echo(f"Note ID: {note.note_id}")
+    click.echo(f"Model: {note.model_name}")
+    click.echo(f"Tags: {', '.join(note.tags) if note.tags else '(none)'}")
+    click.echo(f"Cards: {', '.join(map(str, note.cards)) if note.cards else '(none)'}")
+    click.echo("\nFields:")
+
+    for field_name, field_value in note.fields.items():
+        # Handle multiline values
+        lines = field_value.split("\n")
+        click.echo(f"  {field_name}:")
+        for line in lines:
+            click.echo(f"    {line}")
+
+
 @cli.command("show-note")
-@click.option("--id", "note_id", type=int, required=True, help="Note ID to display")
+@click.option(
+    "--id",
+    "note_ids",
+    type=int,
+    multiple=True,
+    required=True,
+    help="Note ID to display (can be specified multiple times)",
+)
 @click.pass_context
-def show_note(ctx: Any, note_id: int) -> None:
-    """Show detailed information about a note."""
-    repo: AnkiRepository = ctx.obj["repository"]
+def show_note(ctx: Any, note_ids: tuple[int, ...]) -> None:
+    """Show detailed information about one or more notes."""
+    repo = _get_repository(ctx)
 
     try:
-        note = repo.get_note_detail(note_id)
-
-        click.echo(f"Note ID: {note.note_id}")
-        click.echo(f"Model: {note.model_name}")
-        click.echo(f"Tags: {', '.join(note.tags) if note.tags else '(none)'}")
-        click.echo(
-            f"Cards: {', '.join(map(str, note.cards)) if note.cards else '(none)'}"
-        )
-        click.echo("\nFields:")
-
-        for field_name, field_value in note.fields.items():
-            # Handle multiline values
-            lines = field_value.split("\n")
-            click.echo(f"  {field_name}:")
-            for line in lines:
-                click.echo(f"    {line}")
+        # Fetch every requested note in one lookup
+        for index, note in enumerate(repo.get_notes_detail(list(note_ids))):
+            if index:
+                click.echo()
+            _print_note(note)
     except Exception as e:
         click.echo(f"Error: {e}", err=True)
         sys.exit(1)
@@ -168,20 +247,8 @@ def add_note(
     ctx: Any, deck: str, model: str, fields: tuple[str, ...], tags: tuple[str, ...]
 ) -> None:
     """Add a new note to Anki."""
-    repo: AnkiRepository = ctx.obj["repository"]
-
-    # Parse field arguments
-    field_dict: dict[str, str] = {}
-    for field_arg in fields:
-        if "=" not in field_arg:
-            click.echo(
-                f"Error: Invalid field format '{field_arg}'. Expected 'FieldName=value'",
-                err=True,
-            )
-            sys.exit(1)
-
-        field_name, field_value = field_arg.split("=", 1)
-        field_dict[field_name.strip()] = field_value.strip()
+    field_dict = _parse_fields(fields)
+    repo = _get_repository(ctx)
 
     tag_list = list(tags) if tags else None
 
@@ -193,6 +260,65 @@ def add_note(
         sys.exit(1)
 
 
+@cli.command("add-notes")
+@click.argument("source", type=click.File("r"), default="-")
+@click.option(
+    "--batch-size",
+    type=click.IntRange(min=1),
+    default=500,
+    help="Number of notes sent per addNotes request",
+)
+@click.pass_context
+def add_notes(ctx: Any, source: Any, batch_size: int) -> None:
+    """Add many notes from a JSON Lines file (or stdin).
+
+    Each line is an object with "deck", "model", "fields" and optional
+    "tags" keys. Notes are sent in batches, so bulk imports need one
+    process and one request per batch instead of one add-note per note.
+    """
+    repo = _get_repository(ctx)
+    created = 0
+    failed = 0
+
+    def flush(batch: list[tuple[int, dict[str, Any]]]) -> None:
+        nonlocal created, failed
+        note_ids = repo.create_notes([spec for _, spec in batch])
+        for (line_no, _), note_id in zip(batch, note_ids, strict=True):
+            if note_id is None:
+                failed += 1
+                click.echo(f"Line {line_no}: could not add note", err=True)
+            else:
+                created += 1
+                click.echo(f"Line {line_no}: created note {note_id}")
+
+    try:
+        batch: list[tuple[int, dict[str, Any]]] = []
+        for line_no, line in enumerate(source, start=1):
+            if not line.strip():
+                continue
+            try:
+                spec = json.loads(line)
+                if not {"deck", "model", "fields"} <= spec.keys():
+                    raise ValueError("expected 'deck', 'model' and 'fields' keys")
+            except (ValueError, AttributeError) as e:
+                click.echo(f"Error: Invalid note on line {line_no}: {e}", err=True)
+                sys.exit(1)
+
+            batch.append((line_no, spec))
+            if len(batch) >= batch_size:
+                flush(batch)
+                batch = []
+        if batch:
+            flush(batch)
+    except Exception as e:
+        click.echo(f"Error: {e}", err=True)
+        sys.exit(1)
+
+    click.echo(f"Created {created} note(s), {failed} failed")
+    if failed:
+        sys.exit(1)
+
+
 @cli.command("edit-note")
 @click.option("--id", "note_id", type=int, required=True, help="Note ID to edit")
 @click.option(
@@ -205,28 +331,16 @@ def add_note(
 @click.pass_context
 def edit_note(ctx: Any, note_id: int, fields: tuple[str, ...]) -> None:
     """Edit an existing note's fields."""
-    repo: AnkiRepository = ctx.obj["repository"]
-
-    # Parse field arguments
-    field_dict: dict[str, str] = {}
-    for field_arg in fields:
-        if "=" not in field_arg:
-            click.echo(
-                f"Error: Invalid field format '{field_arg}'. Expected 'FieldName=value'",
-                err=True,
-            )
-            sys.exit(1)
-
-        field_name, field_value = field_arg.split("=", 1)
-        field_dict[field_name.strip()] = field_value.strip()
+    field_dict = _parse_fields(fields)
+    repo = _get_repository(ctx)
 
     try:
-        repo.update_note(note_id, field_dict)
+        # Update and read back in one round trip
+        note = repo.update_note_and_get(note_id, field_dict)
         click.echo(f"Successfully updated note {note_id}")
 
-        # Show updated note
         click.echo("\nUpdated note:")
-        ctx.invoke(show_note, note_id=note_id)
+        _print_note(note)
     except Exception as e:
         click.echo(f"Error: {e}", err=True)
         sys.exit(1)
@@ -236,7 +350,7 @@ def edit_note(ctx: Any, note_id: int, fields: tuple[str, ...]) -> None:
 @click.pass_context
 def check_connection(ctx: Any) -> None:
     """Check if AnkiConnect is accessible."""
-    repo: AnkiRepository = ctx.obj["repository"]
+    repo = _get_repository(ctx)
 
     try:
         if repo.check_connection():
@@ -255,13 +369,16 @@ def check_connection(ctx: Any) -> None:
 def launch_anki(timeout: float) -> None:
     """Launch Anki with AnkiConnect support."""
     manager = AnkiProcessManager()
+    try:
+        if manager.is_ankiconnect_running():
+            click.echo("Anki is already running.")
+            return
 
-    if manager.is_ankiconnect_running():
-        click.echo("Anki is already running.")
-        return
-
-    click.echo(f"Launching Anki (timeout: {timeout}s)...")
-    success = manager.launch_anki(timeout=timeout)
+        click.echo(f"Launching Anki (timeout: {timeout}s)...")
+        success = manager.launch_anki(timeout=timeout)
+    finally:
+        # Only the probe client is released; Anki itself keeps running
+        manager.close()
 
     if success:
         click.echo("✓ Anki launched successfully and AnkiConnect is accessible")
@@ -5,14 +5,40 @@ models (Deck, NoteType, Note) and hide AnkiConnect implementation details.
 """
 
 import logging
-from typing import Any
-
+import time
+from collections.abc import Callable, Iterator
+from typing import Any, TypeVar
+
+from ..exceptions import (
+    AnkiConnectAPIError,
+    DeckNotFoundError,
+    InvalidNoteError,
+    ModelNotFoundError,
+    NoteNotFoundError,
+)
 from ..models import Deck, Note, NoteType
-from .api import AnkiConnectAPI
+from .api import NOTES_INFO_CHUNK_SIZE, AnkiConnectAPI
 from .transport import AnkiConnectTransport
 
 logger = logging.getLogger(__name__)
 
+T = TypeVar("T")
+
+# Seconds that deck/model lookups are reused before asking AnkiConnect again
+CACHE_TTL = 60.0
+
+
+def _escape_deck(name: str) -> str:
+    """Escape a deck name for use inside a quoted Anki search term.
+
+    Args:
+        name: The deck name.
+
+    Returns:
+        The name with backslashes and double quotes escaped.
+    """
+    return name.replace("\\", "\\\\").replace('"', '\\"')
+
 
 class AnkiRepository:
     """High-level repository for Anki operations.
@@ -20,6 +46,9 @@ class AnkiRepository:
     Provides business-oriented operations that return domain models and
     combine multiple API calls when needed. This is the primary interface
     for application code interacting with Anki.
+
+    Deck and note type name/ID maps and per-model field names are cached for
+    CACHE_TTL seconds; call invalidate() to force fresh lookups.
     """
 
     def __init__(
@@ -46,6 +75,9 @@ class AnkiRepository:
 
         self.transport = AnkiConnectTransport(**transport_kwargs)
         self.api = AnkiConnectAPI(self.transport)
+        # Deck/model lookups change rarely; cache them briefly to save
+        # round trips. Keyed by lookup name, valued by (timestamp, result).
+        self._cache: dict[str, tuple[float, Any]] = {}
         logger.debug("Initialized AnkiRepository")
 
     def __enter__(self) -> "AnkiRepository":
@@ -60,6 +92,21 @@ class AnkiRepository:
         """Close the underlying connections."""
         self.transport.close()
 
+    def invalidate(self) -> None:
+        """Drop cached deck, note type and field lookups."""
+        self._cache.clear()
+
+    def _cached(self, key: str, loader: Callable[[], T]) -> T:
+        """Return a cached lookup result, calling loader when stale or missing."""
+        entry = self._cache.get(key)
+        now = time.monotonic()
+        if entry is not None and now - entry[0] < CACHE_TTL:
+            result: T = entry[1]
+            return result
+        value = loader()
+        self._cache[key] = (now, value)
+        return value
+
     def check_connection(self) -> bool:
         """Check if AnkiConnect is accessible.
 
@@ -80,9 +127,13 @@ class AnkiRepository:
         """
         return self.transport.get_version()
 
-    def list_decks(self) -> list[Deck]:
+    def list_decks(self, *, names_and_ids: dict[str, int] | None = None) -> list[Deck]:
         """Get a list of all decks.
 
+        Args:
+            names_and_ids: Optional deck name to ID mapping already fetched
+                via deckNamesAndIds; skips the API call when given.
+
         Returns:
             List of Deck objects with names and IDs.
 
@@ -90,12 +141,28 @@ class AnkiRepository:
             AnkiConnectConnectionError: If unable to connect.
             AnkiConnectAPIError: If the API returns an error.
         """
-        decks_dict = self.api.get_decks_with_ids()
+        decks_dict = (
+            names_and_ids
+            if names_and_ids is not None
+            else self.get_deck_names_and_ids()
+        )
         return [Deck(name=name, id=deck_id) for name, deck_id in decks_dict.items()]
 
-    def list_models(self) -> list[NoteType]:
+    def list_models(
+        self,
+        *,
+        names_and_ids: dict[str, int] | None = None,
+        include_fields: bool = True,
+    ) -> list[NoteType]:
         """Get a list of all note types.
 
+        Args:
+            names_and_ids: Optional note type name to ID mapping already
+                fetched via modelNamesAndIds; skips the API call when given.
+            include_fields: Whether to fetch field names for each note type.
+                When False, NoteType.fields is left empty and no field
+                lookups are made.
+
         Returns:
             List of NoteType objects with names and IDs.
 
@@ -103,12 +170,39 @@ class AnkiRepository:
             AnkiConnectConnectionError: If unable to connect.
             AnkiConnectAPIError: If the API returns an error.
         """
-        models_dict = self.api.get_model_names_and_ids()
+        models_dict = (
+            names_and_ids
+            if names_and_ids is not None
+            else self.get_model_names_and_ids()
+        )
+        if not include_fields:
+            return [
+                NoteType(name=name, id=model_id)
+                for name, model_id in models_dict.items()
+            ]
+
+        names = list(models_dict)
+        try:
+            # Fetch field names for every model in a single round trip
+            all_fields = self.api.batch(
+                [("modelFieldNames", {"modelName": name}) for name in names]
+            )
+        except AnkiConnectAPIError as e:
+            logger.debug("Batched field lookup failed, fetching per model: %s", e)
+        else:
+            now = time.monotonic()
+            for name, fields in zip(names, all_fields, strict=True):
+                self._cache[f"fields:{name}"] = (now, fields)
+            return [
+                NoteType(name=name, id=models_dict[name], fields=list(fields))
+                for name, fields in zip(names, all_fields, strict=True)
+            ]
+
         note_types = []
         for name, model_id in models_dict.items():
             # Fetch field names for each model
             try:
-                fields = self.api.get_model_field_names(name)
+                fields = self.get_model_fields(name)
                 note_types.append(NoteType(name=name, id=model_id, fields=fields))
             except Exception as e:
                 logger.warning(f"Could not fetch fields for model '{name}': {e}")
@@ -129,7 +223,11 @@ class AnkiRepository:
             AnkiConnectAPIError: If the API returns an error.
             ModelNotFoundError: If the note type does not exist.
         """
-        return self.api.get_model_field_names(model_name)
+        fields = self._cached(
+            f"fields:{model_name}",
+            lambda: self.api.get_model_field_names(model_name),
+        )
+        return list(fields)
 
     def list_notes_in_deck(self, deck: str, limit: int | None = None) -> list[Note]:
         """Get notes in a specific deck.
@@ -145,7 +243,7 @@ class AnkiRepository:
             AnkiConnectConnectionError: If unable to connect.
             AnkiConnectAPIError: If the API returns an error or query is invalid.
         """
-        query = f'deck:"{deck}"'
+        query = f'deck:"{_escape_deck(deck)}"'
         note_ids = self.api.find_note_ids(query)
 
         if limit is not None:
@@ -157,6 +255,71 @@ class AnkiRepository:
         notes_data = self.api.get_notes_info(note_ids)
         return [Note.from_api_response(note_data) for note_data in notes_data]
 
+    def list_notes_in_decks(
+        self, decks: list[str], limit: int | None = None
+    ) -> list[Note]:
+        """Get notes from several decks with a single search.
+
+        Args:
+            decks: The deck names to search.
+            limit: Optional limit on number of notes to return.
+
+        Returns:
+            List of Note objects from any of the decks.
+
+        Raises:
+            AnkiConnectConnectionError: If unable to connect.
+            AnkiConnectAPIError: If the API returns an error or query is invalid.
+        """
+        if not decks:
+            return []
+
+        terms = " OR ".join(f'deck:"{_escape_deck(deck)}"' for deck in decks)
+        note_ids = self.api.find_note_ids(f"({terms})")
+
+        if limit is not None:
+            note_ids = note_ids[:limit]
+
+        if not note_ids:
+            return []
+
+        notes_data = self.api.get_notes_info(note_ids)
+        return [Note.from_api_response(note_data) for note_data in notes_data]
+
+    def iter_notes_in_deck(
+        self,
+        deck: str,
+        limit: int | None = None,
+        batch_size: int = NOTES_INFO_CHUNK_SIZE,
+    ) -> Iterator[Note]:
+        """Yield notes in a specific deck, fetching them in batches.
+
+        Unlike list_notes_in_deck, only one batch of note data is held at a
+        time, so callers can start processing before the whole deck is read.
+
+        Args:
+            deck: The deck name to search.
+            limit: Optional limit on number of notes to yield.
+            batch_size: Number of notes to fetch per notesInfo request.
+
+        Yields:
+            Note objects from the deck, in search order.
+
+        Raises:
+            AnkiConnectConnectionError: If unable to connect.
+            AnkiConnectAPIError: If the API returns an error or query is invalid.
+        """
+        query = f'deck:"{_escape_deck(deck)}"'
+        note_ids = self.api.find_note_ids(query)
+
+        if limit is not None:
+            note_ids = note_ids[:limit]
+
+        for start in range(0, len(note_ids), batch_size):
+            notes_data = self.api.get_notes_info(note_ids[start : start + batch_size])
+            for note_data in notes_data:
+                yield Note.from_api_response(note_data)
+
     def get_note_detail(self, note_id: int) -> Note:
         """Get detailed information about a single note.
 
@@ -169,13 +332,39 @@ class AnkiRepository:
         Raises:
             AnkiConnectConnectionError: If unable to connect.
             AnkiConnectAPIError: If the API returns an error.
+            NoteNotFoundError: If the note does not exist.
         """
-        notes_data = self.api.get_notes_info([note_id])
-        if not notes_data:
-            from ..exceptions import NoteNotFoundError
+        return self.get_notes_detail([note_id])[0]
+
+    def get_notes_detail(self, note_ids: list[int]) -> list[Note]:
+        """Get detailed information about several notes with one lookup.
 
-            raise NoteNotFoundError(f"Note {note_id} not found")
-        return Note.from_api_response(notes_data[0])
+        All IDs are resolved through a single notesInfo call (split into
+        concurrent chunks for very large lists) rather than one request per
+        note.
+
+        Args:
+            note_ids: The IDs of the notes to retrieve.
+
+        Returns:
+            Note objects in the same order as note_ids.
+
+        Raises:
+            AnkiConnectConnectionError: If unable to connect.
+            AnkiConnectAPIError: If the API returns an error.
+            NoteNotFoundError: If any of the notes does not exist.
+        """
+        if not note_ids:
+            return []
+
+        notes_data = self.api.get_notes_info(note_ids)
+        notes = []
+        for index, note_id in enumerate(note_ids):
+            # notesInfo returns an empty object for unknown IDs
+            if index >= len(notes_data) or not notes_data[index]:
+                raise NoteNotFoundError(f"Note {note_id} not found")
+            notes.append(Note.from_api_response(notes_data[index]))
+        return notes
 
     def create_note(
         self,
@@ -202,7 +391,29 @@ class AnkiRepository:
             ModelNotFoundError: If the note type does not exist.
             InvalidNoteError: If the note data is invalid.
         """
-        return self.api.add_note(deck, model, field_values, tags)
+        try:
+            return self.api.add_note(deck, model, field_values, tags)
+        except (DeckNotFoundError, ModelNotFoundError, InvalidNoteError):
+            # Cached decks/fields may be stale; refetch on the next lookup
+            self.invalidate()
+            raise
+
+    def create_notes(self, specs: list[dict[str, Any]]) -> list[int | None]:
+        """Create several notes in Anki with one request.
+
+        Args:
+            specs: Note specifications, each with 'deck', 'model', 'fields'
+                and optional 'tags' keys.
+
+        Returns:
+            List of new note IDs in input order, with None for notes that
+            could not be created.
+
+        Raises:
+            AnkiConnectConnectionError: If unable to connect.
+            AnkiConnectAPIError: If the API returns an error.
+        """
+        return self.api.add_notes(specs)
 
     def update_note(self, note_id: int, field_values: dict[str, str]) -> None:
         """Update the fields of an existing note.
@@ -217,7 +428,38 @@ class AnkiRepository:
             NoteNotFoundError: If the note does not exist.
             InvalidNoteError: If the field data is invalid.
         """
-        self.api.update_note_fields(note_id, field_values)
+        try:
+            self.api.update_note_fields(note_id, field_values)
+        except InvalidNoteError:
+            # Cached field names may be stale; refetch on the next lookup
+            self.invalidate()
+            raise
+
+    def update_note_and_get(self, note_id: int, field_values: dict[str, str]) -> Note:
+        """Update the fields of an existing note and return the updated note.
+
+        The update and the read-back are sent as a single request.
+
+        Args:
+            note_id: The ID of the note to update.
+            field_values: Dictionary mapping field names to their new values.
+
+        Returns:
+            Note object reflecting the update.
+
+        Raises:
+            AnkiConnectConnectionError: If unable to connect.
+            AnkiConnectAPIError: If the API returns an error.
+            NoteNotFoundError: If the note does not exist.
+            InvalidNoteError: If the field data is invalid.
+        """
+        try:
+            note_data = self.api.update_note_fields_and_get_info(note_id, field_values)
+        except InvalidNoteError:
+            # Cached field names may be stale; refetch on the next lookup
+            self.invalidate()
+            raise
+        return Note.from_api_response(note_data)
 
     # Backward compatibility aliases for old method names
     def get_deck_names(self) -> list[str]:
@@ -234,15 +476,18 @@ class AnkiRepository:
         Returns:
             Dictionary mapping deck names to IDs.
         """
-        return self.api.get_decks_with_ids()
+        return dict(self._cached("decks", self.api.get_decks_with_ids))
 
-    def get_decks(self) -> list[Deck]:
+    def get_decks(self, *, names_and_ids: dict[str, int] | None = None) -> list[Deck]:
         """Get all decks (backward compatibility).
 
+        Args:
+            names_and_ids: Optional pre-fetched deck name to ID mapping.
+
         Returns:
             List of Deck objects.
         """
-        return self.list_decks()
+        return self.list_decks(names_and_ids=names_and_ids)
 
     def find_notes(self, query: str) -> list[int]:
         """Find notes matching a query (backward compatibility).
@@ -281,15 +526,26 @@ class AnkiRepository:
         Returns:
             Dictionary mapping note type names to IDs.
         """
-        return self.api.get_model_names_and_ids()
+        return dict(self._cached("models", self.api.get_model_names_and_ids))
 
-    def get_note_types(self) -> list[NoteType]:
+    def get_note_types(
+        self,
+        *,
+        names_and_ids: dict[str, int] | None = None,
+        include_fields: bool = True,
+    ) -> list[NoteType]:
         """Get all note types (backward compatibility).
 
+        Args:
+            names_and_ids: Optional pre-fetched note type name to ID mapping.
+            include_fields: Whether to fetch field names for each note type.
+
         Returns:
             List of NoteType objects.
         """
-        return self.list_models()
+        return self.list_models(
+            names_and_ids=names_and_ids, include_fields=include_fields
+        )
 
     def get_model_field_names(self, model_name: str) -> list[str]:
         """Get field names for a note type (backward compatibility).
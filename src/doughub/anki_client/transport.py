@@ -4,11 +4,17 @@ This module provides the HTTP client layer that handles communication with
 AnkiConnect, request/response formatting, and basic error handling.
 """
 
+import json
 import logging
 from typing import Any
 
 import httpx
 
+try:
+    import orjson
+except ImportError:  # Optional speedup, fall back to the stdlib
+    orjson = None  # type: ignore[assignment]
+
 from ..config import (
     ANKICONNECT_TIMEOUT,
     ANKICONNECT_URL,
@@ -21,6 +27,34 @@ from ..exceptions import (
 
 logger = logging.getLogger(__name__)
 
+_JSON_HEADERS = {"Content-Type": "application/json"}
+
+# Connection attempts retried at the transport level (e.g. while AnkiConnect
+# restarts). Only failed connects are retried, so requests are never resent.
+_CONNECT_RETRIES = 1
+
+# Idle keep-alive connections are kept this long (seconds) so consecutive
+# calls from one command reuse the same socket
+_KEEPALIVE_EXPIRY = 30.0
+
+# Idle connections kept open; the API layer runs this many concurrent
+# notesInfo requests, so none of their sockets are torn down between chunks
+MAX_KEEPALIVE_CONNECTIONS = 4
+
+
+def _dumps(obj: Any) -> bytes:
+    """Encode a request payload as JSON bytes, using orjson when available."""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj).encode("utf-8")
+
+
+def _loads(content: bytes) -> Any:
+    """Decode a JSON response body, using orjson when available."""
+    if orjson is not None:
+        return orjson.loads(content)
+    return json.loads(content)
+
 
 class AnkiConnectTransport:
     """Low-level HTTP client for AnkiConnect API.
@@ -50,8 +84,18 @@ class AnkiConnectTransport:
         self.url = url
         self.version = version
         self.timeout = timeout
-        self._client = httpx.Client(timeout=timeout)
-        logger.debug(f"Initialized AnkiConnect transport: {url} (version {version})")
+        self._client = httpx.Client(
+            timeout=timeout,
+            transport=httpx.HTTPTransport(
+                retries=_CONNECT_RETRIES,
+                limits=httpx.Limits(
+                    max_connections=8,
+                    max_keepalive_connections=MAX_KEEPALIVE_CONNECTIONS,
+                    keepalive_expiry=_KEEPALIVE_EXPIRY,
+                ),
+            ),
+        )
+        logger.debug("Initialized AnkiConnect transport: %s (version %s)", url, version)
 
     def __enter__(self) -> "AnkiConnectTransport":
         """Context manager entry."""
@@ -87,10 +131,14 @@ class AnkiConnectTransport:
         if params is not None:
             payload["params"] = params
 
-        logger.debug(f"Invoking AnkiConnect action: {action} with params: {params}")
+        # Lazy %-formatting: params can be large (e.g. thousands of note IDs)
+        # and should only be rendered when debug logging is enabled
+        logger.debug("Invoking AnkiConnect action: %s with params: %s", action, params)
 
         try:
-            response = self._client.post(self.url, json=payload)
+            response = self._client.post(
+                self.url, content=_dumps(payload), headers=_JSON_HEADERS
+            )
             response.raise_for_status()
         except httpx.ConnectError as e:
             logger.error(f"Failed to connect to AnkiConnect at {self.url}: {e}")
@@ -105,7 +153,7 @@ class AnkiConnectTransport:
             ) from e
 
         try:
-            data = response.json()
+            data = _loads(response.content)
         except Exception as e:
             logger.error(f"Failed to parse AnkiConnect response: {e}")
             raise AnkiConnectAPIError(
@@ -124,9 +172,52 @@ class AnkiConnectTransport:
             logger.error(f"AnkiConnect API error for action '{action}': {error_msg}")
             raise AnkiConnectAPIError(error_msg, action=action)
 
-        logger.debug(f"AnkiConnect action '{action}' succeeded")
+        logger.debug("AnkiConnect action '%s' succeeded", action)
         return data.get("result")
 
+    def invoke_multi(self, actions: list[dict[str, Any]]) -> list[Any]:
+        """Invoke several actions in a single request via the `multi` action.
+
+        Args:
+            actions: List of {"action": ..., "params": ...} dicts, in order.
+
+        Returns:
+            List of raw results, one per action, in the same order.
+
+        Raises:
+            AnkiConnectConnectionError: If unable to connect to AnkiConnect.
+            AnkiConnectAPIError: If the request or any individual action fails.
+        """
+        if not actions:
+            return []
+
+        # Each action carries the API version so results come back wrapped
+        # in {"result": ..., "error": ...} envelopes
+        wrapped = [{**action, "version": self.version} for action in actions]
+        responses = self.invoke("multi", {"actions": wrapped})
+
+        if not isinstance(responses, list) or len(responses) != len(actions):
+            raise AnkiConnectAPIError(
+                "Malformed response from AnkiConnect (unexpected multi result)",
+                action="multi",
+            )
+
+        results = []
+        for action, response in zip(actions, responses, strict=True):
+            if isinstance(response, dict) and "error" in response:
+                if response["error"] is not None:
+                    logger.error(
+                        f"AnkiConnect API error for action "
+                        f"'{action['action']}': {response['error']}"
+                    )
+                    raise AnkiConnectAPIError(
+                        response["error"], action=action["action"]
+                    )
+                results.append(response.get("result"))
+            else:
+                results.append(response)
+        return results
+
     def get_version(self) -> int:
         """Get the AnkiConnect API version.
 
@@ -5,18 +5,61 @@ and other development/operational tasks.
 """
 
 import os
-import subprocess
 import sys
-from typing import cast
+from collections.abc import Iterator
+from contextlib import contextmanager
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
 
 import typer
 
+# subprocess and concurrent.futures are only needed by health-check; they are
+# imported inside the functions that use them to keep `doughub --help` fast
+if TYPE_CHECKING:
+    import subprocess
+
+    from sqlalchemy.orm import Session
+
 app = typer.Typer(
     name="doughub",
     help="Python-based tooling for Anki deck management",
     add_completion=False,
 )
 
+# Validation pipeline stages, in run order
+ALL_STAGES = (0, 1, 2, 3)
+
+# Validation stages that do not talk to a live Anki instance
+LOCAL_STAGES = frozenset({0})
+
+# Row template for the source-summary table, parsed once at import
+_SOURCE_ROW = "{name:<30} {count:<15} {desc}".format_map
+
+# Source descriptions longer than this are truncated in source-summary
+_SOURCE_DESC_WIDTH = 30
+
+
+def _version_callback(value: bool) -> None:
+    """Print the package version and exit when --version is given."""
+    if value:
+        from doughub import __version__
+
+        typer.echo(f"doughub {__version__}")
+        raise typer.Exit()
+
+
+@app.callback()
+def _main_options(
+    version: bool = typer.Option(
+        False,
+        "--version",
+        callback=_version_callback,
+        is_eager=True,
+        help="Show the version and exit",
+    ),
+) -> None:
+    """Global options for the doughub CLI."""
+
 
 def _print_header(text: str) -> None:
     """Print a styled header."""
@@ -25,6 +68,27 @@ def _print_header(text: str) -> None:
     typer.echo(f"{'=' * 70}\n")
 
 
+def _echo_lines(lines: list[str]) -> None:
+    """Print many lines with a single write.
+
+    Use typer.style for colored lines; typer.echo still strips the styling
+    when output is not a terminal.
+    """
+    typer.echo("\n".join(lines))
+
+
+def _echo_json(payload: dict[str, Any]) -> None:
+    """Print a JSON-serializable payload on one line, using orjson if available."""
+    try:
+        import orjson
+    except ImportError:  # Optional speedup, fall back to the stdlib
+        import json
+
+        typer.echo(json.dumps(payload))
+    else:
+        typer.echo(orjson.dumps(payload).decode())
+
+
 def _print_success(text: str) -> None:
     """Print a success message."""
     typer.secho(f"✓ {text}", fg=typer.colors.GREEN)
@@ -51,22 +115,22 @@ def _get_stage_description(stage: int) -> str:
     return descriptions.get(stage, "Unknown stage")
 
 
-def _run_validation_stage(
-    stage: int, fail_fast: bool = False, auto_launch: bool = False
-) -> bool:
-    """Run a specific validation stage.
+def _run_stage_process(
+    stage: int, fail_fast: bool, auto_launch: bool, capture: bool
+) -> "subprocess.CompletedProcess[str]":
+    """Run pytest for a validation stage in a subprocess.
 
     Args:
         stage: The stage number (0-3).
         fail_fast: Whether to stop at first test failure.
         auto_launch: Whether to auto-launch Anki if needed.
+        capture: Whether to capture output instead of streaming it.
 
     Returns:
-        True if the stage passed, False otherwise.
+        The completed pytest process.
     """
-    _print_header(f"Stage {stage}: {_get_stage_description(stage)}")
+    import subprocess
 
-    # Build pytest command
     cmd = [
         sys.executable,
         "-m",
@@ -80,15 +144,19 @@ def _run_validation_stage(
     if fail_fast:
         cmd.append("-x")
 
+    # Give the child its own environment so the CLI process is left untouched
+    env = os.environ.copy()
     if auto_launch:
-        # Set environment variable to enable auto-launch
-        os.environ["ENABLE_ANKI_AUTO_LAUNCH"] = "true"
+        env["ENABLE_ANKI_AUTO_LAUNCH"] = "true"
+
+    if not capture:
+        _print_info(f"Running: {' '.join(cmd)}\n")
+    return subprocess.run(cmd, env=env, capture_output=capture, text=capture)
 
-    # Run pytest
-    _print_info(f"Running: {' '.join(cmd)}\n")
-    result = subprocess.run(cmd)
 
-    if result.returncode == 0:
+def _report_stage_result(stage: int, returncode: int) -> bool:
+    """Print the outcome of a validation stage and return whether it passed."""
+    if returncode == 0:
         _print_success(f"Stage {stage} passed\n")
         return True
     else:
@@ -96,6 +164,74 @@ def _run_validation_stage(
         return False
 
 
+def _run_validation_stage(
+    stage: int, fail_fast: bool = False, auto_launch: bool = False
+) -> bool:
+    """Run a specific validation stage.
+
+    Args:
+        stage: The stage number (0-3).
+        fail_fast: Whether to stop at first test failure.
+        auto_launch: Whether to auto-launch Anki if needed.
+
+    Returns:
+        True if the stage passed, False otherwise.
+    """
+    _print_header(f"Stage {stage}: {_get_stage_description(stage)}")
+    result = _run_stage_process(stage, fail_fast, auto_launch, capture=False)
+    return _report_stage_result(stage, result.returncode)
+
+
+def _run_stage_group(
+    stages: list[int], auto_launch: bool
+) -> list[tuple[int, "subprocess.CompletedProcess[str]"]]:
+    """Run a group of stages one after another, capturing their output."""
+    return [
+        (stage, _run_stage_process(stage, False, auto_launch, capture=True))
+        for stage in stages
+    ]
+
+
+def _run_validation_stages_concurrently(stages: list[int], auto_launch: bool) -> bool:
+    """Run local and live-Anki stages in parallel.
+
+    Stage 0 needs no Anki, so it runs alongside the live stages. The live
+    stages share AnkiConnect state and stay sequential among themselves.
+    Output is captured and printed per stage once everything has finished.
+
+    Args:
+        stages: Sorted stage numbers to run.
+        auto_launch: Whether to auto-launch Anki if needed.
+
+    Returns:
+        True if every stage passed, False otherwise.
+    """
+    from concurrent.futures import ThreadPoolExecutor
+
+    local = [s for s in stages if s in LOCAL_STAGES]
+    live = [s for s in stages if s not in LOCAL_STAGES]
+
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        futures = [
+            executor.submit(_run_stage_group, group, auto_launch)
+            for group in (local, live)
+        ]
+        results = sorted(
+            (item for future in futures for item in future.result()),
+            key=lambda item: item[0],
+        )
+
+    all_passed = True
+    for stage, result in results:
+        _print_header(f"Stage {stage}: {_get_stage_description(stage)}")
+        typer.echo(result.stdout, nl=False)
+        if result.stderr:
+            typer.echo(result.stderr, nl=False, err=True)
+        if not _report_stage_result(stage, result.returncode):
+            all_passed = False
+    return all_passed
+
+
 @app.command()
 def health_check(
     stage: list[int] | None = None,
@@ -110,8 +246,12 @@ def health_check(
     - Stage 2: Core contract checks
     - Stage 3: Negative-path robustness checks
     """
-    # Determine which stages to run
-    stages_to_run = stage if stage else [0, 1, 2, 3]
+    # Determine which stages to run, each at most once and in order
+    stages_to_run = sorted(set(stage)) if stage else list(ALL_STAGES)
+    unknown = [s for s in stages_to_run if s not in ALL_STAGES]
+    if unknown:
+        _print_error(f"Unknown stage(s): {', '.join(map(str, unknown))}")
+        raise typer.Exit(2)
 
     _print_header("AnkiConnect Validation Pipeline Health Check")
     _print_info(f"Running stages: {', '.join(map(str, stages_to_run))}")
@@ -122,15 +262,20 @@ def health_check(
     if auto_launch:
         _print_info("Auto-launch enabled for Anki")
 
-    # Run each stage
+    # Run each stage; without --fail-fast, local stages overlap live ones
+    has_local = any(s in LOCAL_STAGES for s in stages_to_run)
+    has_live = any(s not in LOCAL_STAGES for s in stages_to_run)
     all_passed = True
-    for stage_num in sorted(stages_to_run):
-        passed = _run_validation_stage(stage_num, fail_fast, auto_launch)
-        if not passed:
-            all_passed = False
-            if fail_fast:
-                _print_error("Stopping due to --fail-fast")
-                break
+    if not fail_fast and has_local and has_live:
+        all_passed = _run_validation_stages_concurrently(stages_to_run, auto_launch)
+    else:
+        for stage_num in stages_to_run:
+            passed = _run_validation_stage(stage_num, fail_fast, auto_launch)
+            if not passed:
+                all_passed = False
+                if fail_fast:
+                    _print_error("Stopping due to --fail-fast")
+                    break
 
     # Print summary
     _print_header("Summary")
@@ -173,33 +318,68 @@ notebook_app = typer.Typer(help="Notebook management commands")
 app.add_typer(notebook_app, name="notebook")
 
 
+@contextmanager
+def _db_session() -> Iterator["Session"]:
+    """Open a session on the shared engine for DATABASE_URL.
+
+    The engine is created once per process by get_engine and reused across
+    commands, so only the session is closed here; the pool is not disposed.
+
+    Yields:
+        A SQLAlchemy session, closed on exit.
+    """
+    from sqlalchemy.orm import Session
+
+    from doughub.persistence import get_engine
+
+    with Session(get_engine()) as session:
+        yield session
+
+
 @db_app.command("show-question")
-def show_question(question_id: int) -> None:
+def show_question(
+    question_id: int,
+    as_json: bool = typer.Option(False, "--json", help="Print the question as JSON"),
+) -> None:
     """Display detailed information about a specific question.
 
     Args:
         question_id: The ID of the question to display.
+        as_json: Print a machine-readable JSON object instead of text.
     """
-    from sqlalchemy import create_engine
-    from sqlalchemy.orm import sessionmaker
-
-    from doughub.config import DATABASE_URL
     from doughub.persistence import QuestionRepository
 
-    engine = create_engine(DATABASE_URL)
-    SessionLocal = sessionmaker(bind=engine)
-    session = SessionLocal()
-    repo = QuestionRepository(session)
-
-    try:
-        question = repo.get_question_by_id(question_id)
+    with _db_session() as session:
+        repo = QuestionRepository(session)
+        # Fetch only the displayed columns, with previews truncated in SQL
+        question = repo.get_question_summary(question_id)
         if question is None:
             _print_error(f"Question with ID {question_id} not found")
             raise typer.Exit(1)
 
+        if as_json:
+            _echo_json(
+                {
+                    "question_id": question_id,
+                    "source": question.source_name,
+                    "source_question_key": question.source_question_key,
+                    "status": question.status,
+                    "created_at": question.created_at.isoformat(),
+                    "updated_at": question.updated_at.isoformat(),
+                    "extraction_path": question.extraction_path,
+                    "html_preview": question.html_preview,
+                    "metadata_preview": question.metadata_preview,
+                    "media": [
+                        dict(media._mapping)
+                        for media in repo.get_media_summaries(question_id)
+                    ],
+                }
+            )
+            return
+
         _print_header(f"Question {question_id}")
 
-        typer.echo(f"Source:       {question.source.name}")
+        typer.echo(f"Source:       {question.source_name}")
         typer.echo(f"Source Key:   {question.source_question_key}")
         typer.echo(f"Status:       {question.status}")
         typer.echo(f"Created:      {question.created_at}")
@@ -208,12 +388,13 @@ def show_question(question_id: int) -> None:
         if question.extraction_path:
             typer.echo(f"Path:         {question.extraction_path}")
 
-        typer.echo(f"\nHTML Preview: {question.raw_html[:200]}...")
-        typer.echo(f"\nMetadata:     {question.raw_metadata_json[:200]}...")
+        typer.echo(f"\nHTML Preview: {question.html_preview}...")
+        typer.echo(f"\nMetadata:     {question.metadata_preview}...")
 
-        if question.media:
-            typer.echo(f"\nMedia Files ({len(question.media)}):")
-            for media in question.media:
+        media_files = repo.get_media_summaries(question_id)
+        if media_files:
+            typer.echo(f"\nMedia Files ({len(media_files)}):")
+            for media in media_files:
                 typer.echo(
                     f"  - {media.media_role} ({media.mime_type}): {media.relative_path}"
                 )
@@ -222,50 +403,135 @@ def show_question(question_id: int) -> None:
 
         typer.echo("")
 
-    finally:
-        session.close()
-        engine.dispose()
-
 
 @db_app.command("source-summary")
-def source_summary() -> None:
-    """Display a summary of all sources and their question counts."""
-    from sqlalchemy import create_engine, select
-    from sqlalchemy.orm import sessionmaker
-
-    from doughub.config import DATABASE_URL
-    from doughub.models import Source
-
-    engine = create_engine(DATABASE_URL)
-    SessionLocal = sessionmaker(bind=engine)
-    session = SessionLocal()
+def source_summary(
+    as_json: bool = typer.Option(False, "--json", help="Print the summary as JSON"),
+) -> None:
+    """Display a summary of all sources and their question counts.
 
-    try:
-        stmt = select(Source)
-        sources = session.execute(stmt).scalars().all()
+    Args:
+        as_json: Print a machine-readable JSON object instead of a table.
+    """
+    from sqlalchemy import func, select
+
+    from doughub.models import Question, Source
+
+    with _db_session() as session:
+        # Count questions per source in one grouped query rather than
+        # lazy-loading each source's questions
+        stmt = (
+            select(
+                Source.name,
+                Source.description,
+                func.count(Question.question_id),
+            )
+            .outerjoin(Question, Question.source_id == Source.source_id)
+            .group_by(Source.source_id)
+            .order_by(Source.source_id)
+            .execution_options(yield_per=1000)
+        )
+
+        if as_json:
+            sources = [
+                {"name": name, "description": description, "question_count": count}
+                for name, description, count in session.execute(stmt)
+            ]
+            _echo_json(
+                {
+                    "sources": sources,
+                    "total_sources": len(sources),
+                    "total_questions": sum(s["question_count"] for s in sources),
+                }
+            )
+            return
 
-        if not sources:
+        # Build the whole table while streaming rows and write it at once
+        lines = [
+            _SOURCE_ROW(
+                {"name": "Source Name", "count": "Questions", "desc": "Description"}
+            ),
+            "-" * 70,
+        ]
+        sources_count = 0
+        total_questions = 0
+        for name, description, question_count in session.execute(stmt):
+            sources_count += 1
+            total_questions += question_count
+            desc = description or "(no description)"
+            if len(desc) > _SOURCE_DESC_WIDTH:
+                desc = f"{desc[:_SOURCE_DESC_WIDTH]}..."
+            lines.append(
+                _SOURCE_ROW({"name": name, "count": question_count, "desc": desc})
+            )
+
+        if not sources_count:
             _print_info("No sources found in the database")
             return
 
         _print_header("Source Summary")
+        lines.append(f"\nTotal sources: {sources_count}")
+        lines.append(f"Total questions: {total_questions}\n")
+        _echo_lines(lines)
 
-        typer.echo(f"{'Source Name':<30} {'Questions':<15} {'Description'}")
-        typer.echo("-" * 70)
 
-        for source in sources:
-            question_count = len(source.questions)
-            desc = source.description or "(no description)"
-            desc_short = desc[:30] + "..." if len(desc) > 30 else desc
-            typer.echo(f"{source.name:<30} {question_count:<15} {desc_short}")
+def _coerce_question_id(value: Any) -> int:
+    """Convert a frontmatter question_id to an integer.
 
-        typer.echo(f"\nTotal sources: {len(sources)}")
-        total_questions = sum(len(s.questions) for s in sources)
-        typer.echo(f"Total questions: {total_questions}\n")
+    Frontmatter is hand-edited YAML, so the ID may be quoted ("1") or not
+    a number at all.
 
-    finally:
-        session.close()
-        engine.dispose()
+    Args:
+        value: Raw question_id value from the frontmatter.
+
+    Returns:
+        The question ID as an int.
+
+    Raises:
+        TypeError: If the value is not an int or a string (bools included).
+        ValueError: If a string value is not a whole number.
+    """
+    if isinstance(value, bool) or not isinstance(value, int | str):
+        raise TypeError(f"expected an integer, got {type(value).__name__}")
+    return int(value)
+
+
+def _note_matches_question(value: Any, question_id: int) -> bool:
+    """Return whether a frontmatter question_id refers to the given question."""
+    try:
+        return _coerce_question_id(value) == question_id
+    except (TypeError, ValueError):
+        return False
+
+
+def _parse_frontmatter_concurrently(
+    paths: list[str],
+) -> dict[str, tuple[dict[str, Any] | None, Exception | None]]:
+    """Parse the frontmatter of many note files using a thread pool.
+
+    Reading notes is I/O-bound, so files are parsed in parallel. Parse
+    failures are returned rather than raised so callers can report them.
+
+    Args:
+        paths: Note files to parse.
+
+    Returns:
+        Mapping of each path to (metadata, error); exactly one is not None
+        unless the file simply has no frontmatter.
+    """
+    from concurrent.futures import ThreadPoolExecutor
+
+    from doughub.notebook.sync import _parse_note_frontmatter
+
+    def try_parse(path: str) -> tuple[dict[str, Any] | None, Exception | None]:
+        try:
+            return _parse_note_frontmatter(path), None
+        except Exception as e:
+            return None, e
+
+    max_workers = min(32, (os.cpu_count() or 4) * 4)
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        return dict(zip(paths, executor.map(try_parse, paths), strict=True))
 
 
 @notebook_app.command("check-integrity")
@@ -278,124 +544,155 @@ def check_notebook_integrity() -> None:
     - Note files in the filesystem have corresponding database records
     - Reports orphaned notes and missing files
     """
-    from pathlib import Path
-
-    from sqlalchemy import create_engine, select
-    from sqlalchemy.orm import sessionmaker
+    from sqlalchemy import select
 
-    from doughub.config import DATABASE_URL, NOTES_DIR
+    from doughub.config import NOTES_DIR
     from doughub.models import Question
-    from doughub.notebook.sync import _parse_note_frontmatter
+    from doughub.notebook.sync import _iter_note_files
 
     _print_header("Notebook Integrity Check")
 
-    engine = create_engine(DATABASE_URL)
-    SessionLocal = sessionmaker(bind=engine)
-    session = SessionLocal()
-
     errors = []
     warnings = []
 
-    try:
+    with _db_session() as session:
         notes_dir = Path(NOTES_DIR)
 
         # Check 1: DB -> Filesystem
         _print_info("Checking database records...")
-        stmt = select(Question).where(Question.note_path.isnot(None))
-        questions_with_notes = session.execute(stmt).scalars().all()
-
-        for question in questions_with_notes:
-            note_path = Path(cast(str, question.note_path))
+        # Only the ID and path are needed, so skip loading full question rows
+        stmt = select(Question.question_id, Question.note_path).where(
+            Question.note_path.isnot(None)
+        )
+        # Stream rows in batches so memory stays bounded on large databases
+        result = session.execute(stmt.execution_options(yield_per=1000))
+
+        notes_count = 0
+        # Paths stay plain strings throughout; building a Path per row costs
+        # more than the os.path checks themselves
+        existing: list[tuple[int, str]] = []
+        for question_id, db_note_path in result:
+            notes_count += 1
 
             # Check if file exists
-            if not note_path.exists():
+            if not os.path.exists(db_note_path):
                 errors.append(
-                    f"Missing note file: question_id={question.question_id}, "
-                    f"expected path={question.note_path}"
+                    f"Missing note file: question_id={question_id}, "
+                    f"expected path={db_note_path}"
                 )
                 continue
+            existing.append((question_id, db_note_path))
 
-            # Parse frontmatter and verify question_id matches
-            try:
-                metadata = _parse_note_frontmatter(note_path)
-                if metadata is None:
-                    warnings.append(
-                        f"No frontmatter in note: question_id={question.question_id}, "
-                        f"path={question.note_path}"
-                    )
-                elif metadata.get("question_id") != question.question_id:
-                    errors.append(
-                        f"Question ID mismatch: DB={question.question_id}, "
-                        f"note={metadata.get('question_id')}, path={question.note_path}"
-                    )
-            except Exception as e:
+        parsed = _parse_frontmatter_concurrently([path for _, path in existing])
+
+        for question_id, db_note_path in existing:
+            # Verify the frontmatter question_id matches
+            metadata, error = parsed[db_note_path]
+            if error is not None:
+                errors.append(
+                    f"Failed to parse note: question_id={question_id}, "
+                    f"path={db_note_path}, error={error}"
+                )
+            elif metadata is None:
+                warnings.append(
+                    f"No frontmatter in note: question_id={question_id}, "
+                    f"path={db_note_path}"
+                )
+            elif not _note_matches_question(metadata.get("question_id"), question_id):
                 errors.append(
-                    f"Failed to parse note: question_id={question.question_id}, "
-                    f"path={question.note_path}, error={e}"
+                    f"Question ID mismatch: DB={question_id}, "
+                    f"note={metadata.get('question_id')}, path={db_note_path}"
                 )
 
         # Check 2: Filesystem -> DB
         _print_info("Checking note files...")
-        if notes_dir.exists():
-            for note_file in notes_dir.rglob("*.md"):
-                try:
-                    metadata = _parse_note_frontmatter(note_file)
-                    if metadata is None:
-                        # Skip files without frontmatter
-                        continue
-
-                    question_id = metadata.get("question_id")
-                    if question_id is None:
-                        warnings.append(
-                            f"Note missing question_id in frontmatter: {note_file}"
-                        )
-                        continue
-
-                    # Check if question exists in DB
-                    stmt = select(Question).where(Question.question_id == question_id)
-                    db_question = session.execute(stmt).scalar_one_or_none()
-
-                    if db_question is None:
-                        errors.append(
-                            f"Orphaned note file: question_id={question_id}, "
-                            f"path={note_file}"
-                        )
-                    elif db_question.note_path != str(note_file):
-                        warnings.append(
-                            f"Note path mismatch: question_id={question_id}, "
-                            f"DB path={db_question.note_path}, actual path={note_file}"
-                        )
-
-                except Exception as e:
-                    warnings.append(f"Failed to parse note file: {note_file}, error={e}")
+        # Collect question IDs from every note first, then look them all up
+        # with a single query instead of one query per note file
+        fs_notes: list[tuple[int, str]] = []
+        # A missing notes directory yields nothing; files too small to hold
+        # frontmatter are skipped by the walk
+        note_files = [os.fspath(path) for path in _iter_note_files(notes_dir)]
+        # Reuse results for notes already parsed in the first check
+        parsed.update(
+            _parse_frontmatter_concurrently(
+                [path for path in note_files if path not in parsed]
+            )
+        )
+        for note_file in note_files:
+            metadata, error = parsed[note_file]
+            if error is not None:
+                warnings.append(
+                    f"Failed to parse note file: {note_file}, error={error}"
+                )
+                continue
+
+            if metadata is None:
+                # Skip files without frontmatter
+                continue
+
+            question_id = metadata.get("question_id")
+            if question_id is None:
+                warnings.append(f"Note missing question_id in frontmatter: {note_file}")
+                continue
+
+            try:
+                question_id = _coerce_question_id(question_id)
+            except (TypeError, ValueError) as e:
+                warnings.append(
+                    f"Failed to parse note file: {note_file}, "
+                    f"error=invalid question_id {question_id!r} ({e})"
+                )
+                continue
+
+            fs_notes.append((question_id, note_file))
+
+        db_note_paths: dict[int, str | None] = {}
+        if fs_notes:
+            stmt = select(Question.question_id, Question.note_path).where(
+                Question.question_id.in_({qid for qid, _ in fs_notes})
+            )
+            db_note_paths = dict(session.execute(stmt).all())
+
+        for question_id, note_file in fs_notes:
+            if question_id not in db_note_paths:
+                errors.append(
+                    f"Orphaned note file: question_id={question_id}, path={note_file}"
+                )
+            elif db_note_paths[question_id] != note_file:
+                warnings.append(
+                    f"Note path mismatch: question_id={question_id}, "
+                    f"DB path={db_note_paths[question_id]}, actual path={note_file}"
+                )
 
         # Print summary
         _print_header("Integrity Check Results")
 
-        typer.echo(f"Questions with notes: {len(questions_with_notes)}")
+        typer.echo(f"Questions with notes: {notes_count}")
 
         if not errors and not warnings:
             _print_success("No issues found. Notebook integrity is good.")
         else:
+            # Build the full report and write it at once
+            lines = []
             if errors:
-                typer.echo(f"\n✗ Found {len(errors)} error(s):")
-                for error in errors:
-                    typer.secho(f"  - {error}", fg=typer.colors.RED)
+                lines.append(f"\n✗ Found {len(errors)} error(s):")
+                lines.extend(
+                    typer.style(f"  - {error}", fg=typer.colors.RED) for error in errors
+                )
 
             if warnings:
-                typer.echo(f"\n⚠ Found {len(warnings)} warning(s):")
-                for warning in warnings:
-                    typer.secho(f"  - {warning}", fg=typer.colors.YELLOW)
+                lines.append(f"\n⚠ Found {len(warnings)} warning(s):")
+                lines.extend(
+                    typer.style(f"  - {warning}", fg=typer.colors.YELLOW)
+                    for warning in warnings
+                )
+            _echo_lines(lines)
 
         typer.echo("")
 
         if errors:
             raise typer.Exit(1)
 
-    finally:
-        session.close()
-        engine.dispose()
-
 
 if __name__ == "__main__":
     app()
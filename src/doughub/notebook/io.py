@@ -0,0 +1,32 @@
+"""File helpers for reading and writing notebook notes."""
+
+import os
+from pathlib import Path
+
+# Open flags for whole-file note writes; O_BINARY keeps Windows from
+# translating newlines at the file descriptor level
+_WRITE_FLAGS = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0)
+
+
+def write_note_file(path: Path | str, text: str) -> None:
+    """Write a note file in a single unbuffered call.
+
+    Notes are small and written whole, so the text is encoded once and
+    handed straight to the OS without a buffered/text I/O wrapper.
+
+    Args:
+        path: Destination note file path.
+        text: Full note content.
+
+    Raises:
+        OSError: If the file cannot be written.
+    """
+    data = text.encode("utf-8")
+    fd = os.open(path, _WRITE_FLAGS, 0o644)
+    try:
+        view = memoryview(data)
+        while view:
+            written = os.write(fd, view)
+            view = view[written:]
+    finally:
+        os.close(fd)
@@ -21,6 +21,9 @@ class NotesiumManager:
     Ensures the notes directory exists and the server is accessible.
     """
 
+    # Seconds for which a health probe result is reused by is_healthy()
+    HEALTH_CACHE_TTL = 1.0
+
     def __init__(self, notes_dir: str | None = None, port: int | None = None) -> None:
         """Initialize the Notesium manager.
 
@@ -33,6 +36,7 @@ class NotesiumManager:
         self.process: subprocess.Popen[bytes] | None = None
         self.url = f"http://localhost:{self.port}"
         self._is_healthy = False
+        self._last_probe: tuple[float, bool] | None = None
 
     def start(self) -> bool:
         """Start the Notesium server.
@@ -114,10 +118,14 @@ class NotesiumManager:
                 creationflags=subprocess.CREATE_NO_WINDOW if hasattr(subprocess, "CREATE_NO_WINDOW") else 0,
             )
 
-            # Wait for server to start and check health
-            max_attempts = 10
-            for _attempt in range(max_attempts):
-                time.sleep(0.5)
+            # Wait for server to start and check health, backing off from a
+            # short initial delay so a fast startup is detected promptly
+            startup_timeout = 5.0
+            deadline = time.monotonic() + startup_timeout
+            delay = 0.05
+            while time.monotonic() < deadline:
+                time.sleep(delay)
+                delay = min(delay * 1.5, 1.0)
                 if self._health_check():
                     logger.info(
                         "Notesium server started successfully",
@@ -138,7 +146,7 @@ class NotesiumManager:
                         logger.error(f"STDERR: {stderr}")
                     return False
 
-            logger.error(f"Notesium failed health check after {max_attempts} attempts")
+            logger.error(f"Notesium failed health check within {startup_timeout} seconds")
             # Try to capture any output before stopping
             if self.process and self.process.poll() is None:
                 logger.warning("Process still running but health check failed")
@@ -197,16 +205,32 @@ class NotesiumManager:
             finally:
                 self.process = None
                 self._is_healthy = False
+                self._last_probe = None
         else:
             logger.debug("No Notesium process to stop")
 
     def is_healthy(self) -> bool:
         """Check if the Notesium server is currently healthy.
 
+        Probe results are reused for HEALTH_CACHE_TTL seconds so that
+        back-to-back callers do not each open a new connection.
+
         Returns:
             True if the server is accessible, False otherwise.
         """
-        return self._is_healthy and self._health_check()
+        if not self._is_healthy:
+            return False
+
+        now = time.monotonic()
+        if (
+            self._last_probe is not None
+            and now - self._last_probe[0] < self.HEALTH_CACHE_TTL
+        ):
+            return self._last_probe[1]
+
+        result = self._health_check()
+        self._last_probe = (now, result)
+        return result
 
     def _health_check(self) -> bool:
         """Perform a health check by attempting to connect to the server.
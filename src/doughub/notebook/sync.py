@@ -1,6 +1,7 @@
 """Metadata sync service for syncing note frontmatter to database."""
 
 import logging
+import os
 import re
 from collections.abc import Iterator
 from pathlib import Path
@@ -8,8 +9,60 @@ from typing import Any
 
 import yaml  # type: ignore[import-untyped]
 
+try:
+    # LibYAML's C loader parses much faster when PyYAML was built with it
+    from yaml import CSafeLoader as _SafeLoader
+except ImportError:
+    from yaml import SafeLoader as _SafeLoader  # type: ignore[assignment]
+
 logger = logging.getLogger(__name__)
 
+# Parsed frontmatter per note file, keyed by path and validated against the
+# file's (mtime_ns, size) so unchanged notes skip the YAML parse on rescans.
+# Each completed scan drops entries for notes that are no longer present.
+_frontmatter_cache: dict[Path, tuple[tuple[int, int], dict[str, Any] | None]] = {}
+
+# Smallest file that can hold a frontmatter block ("---", empty body, "---")
+MIN_FRONTMATTER_BYTES = len("---\n\n---\n")
+
+
+def _iter_note_files(notes_dir: Path) -> Iterator[Path]:
+    """Yield markdown files under a directory that could contain frontmatter.
+
+    Walks the tree with os.scandir, reusing each entry's cached stat, and
+    skips files too small to hold a frontmatter block so they are never
+    opened. Files are yielded in name order, each directory's files before
+    its subdirectories. A missing directory yields nothing.
+
+    Args:
+        notes_dir: Directory to walk recursively.
+
+    Yields:
+        Paths of candidate .md files.
+    """
+    stack = [str(notes_dir)]
+    while stack:
+        current = stack.pop()
+        # Sort by name so scans are deterministic across filesystems
+        try:
+            with os.scandir(current) as it:
+                entries = sorted(it, key=lambda entry: entry.name)
+        except (FileNotFoundError, NotADirectoryError):
+            # Root is missing or not a directory (or vanished mid-walk)
+            continue
+
+        subdirs = []
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                subdirs.append(entry.path)
+            elif (
+                entry.name.endswith(".md")
+                and entry.is_file()
+                and entry.stat().st_size >= MIN_FRONTMATTER_BYTES
+            ):
+                yield Path(entry.path)
+        stack.extend(reversed(subdirs))
+
 
 def scan_and_parse_notes(notes_dir: Path) -> Iterator[dict[str, Any]]:
     """Scan notes directory and parse YAML frontmatter from markdown files.
@@ -43,10 +96,12 @@ def scan_and_parse_notes(notes_dir: Path) -> Iterator[dict[str, Any]]:
         return
 
     # Walk directory and find all .md files
-    for md_file in notes_dir.rglob("*.md"):
+    seen: set[Path] = set()
+    for md_file in _iter_note_files(notes_dir):
+        seen.add(md_file)
         try:
             logger.debug(f"Processing note file: {md_file}")
-            metadata = _parse_note_frontmatter(md_file)
+            metadata = _load_note_frontmatter(md_file)
 
             if metadata is None:
                 logger.debug(f"No frontmatter found in {md_file}")
@@ -66,8 +121,56 @@ def scan_and_parse_notes(notes_dir: Path) -> Iterator[dict[str, Any]]:
             logger.error(f"Error processing {md_file}: {e}", exc_info=True)
             continue
 
+    _prune_frontmatter_cache(notes_dir, seen)
+
+
+def _prune_frontmatter_cache(notes_dir: Path, seen: set[Path]) -> None:
+    """Drop cached frontmatter for notes under a directory that were not seen.
+
+    Keeps the cache from growing with deleted or renamed notes in a
+    long-running process. Entries for other directories are left alone.
+
+    Args:
+        notes_dir: Directory that was just scanned completely.
+        seen: Note files found by that scan.
+    """
+    stale = [
+        path
+        for path in _frontmatter_cache
+        if path not in seen and path.is_relative_to(notes_dir)
+    ]
+    for path in stale:
+        _frontmatter_cache.pop(path, None)
+
+
+def _load_note_frontmatter(file_path: Path) -> dict[str, Any] | None:
+    """Return a note's frontmatter, reusing the parsed result if unchanged.
+
+    Args:
+        file_path: Path to the markdown file.
+
+    Returns:
+        A fresh copy of the parsed frontmatter, or None if none was found.
 
-def _parse_note_frontmatter(file_path: Path) -> dict[str, Any] | None:
+    Raises:
+        OSError: If file cannot be read.
+        yaml.YAMLError: If frontmatter is invalid YAML.
+    """
+    stat = file_path.stat()
+    signature = (stat.st_mtime_ns, stat.st_size)
+
+    cached = _frontmatter_cache.get(file_path)
+    if cached is not None and cached[0] == signature:
+        metadata = cached[1]
+    else:
+        metadata = _parse_note_frontmatter(file_path)
+        _frontmatter_cache[file_path] = (signature, metadata)
+
+    # Callers annotate the result, so never hand out the cached dict itself
+    return dict(metadata) if metadata is not None else None
+
+
+def _parse_note_frontmatter(file_path: str | os.PathLike[str]) -> dict[str, Any] | None:
     """Parse YAML frontmatter from a markdown file.
 
     Args:
@@ -81,7 +184,11 @@ def _parse_note_frontmatter(file_path: Path) -> dict[str, Any] | None:
         yaml.YAMLError: If frontmatter is invalid YAML.
     """
     with open(file_path, encoding="utf-8") as f:
-        content = f.read()
+        # Frontmatter must start the file; skip reading the rest otherwise
+        head = f.read(3)
+        if head != "---":
+            return None
+        content = head + f.read()
 
     # Match YAML frontmatter block (--- at start, --- at end)
     # Pattern: start of file, ---, content, ---
@@ -95,7 +202,7 @@ def _parse_note_frontmatter(file_path: Path) -> dict[str, Any] | None:
 
     try:
         # Parse YAML safely
-        metadata = yaml.safe_load(frontmatter_text)
+        metadata = yaml.load(frontmatter_text, Loader=_SafeLoader)
 
         if metadata is None:
             return {}
@@ -1,5 +1,6 @@
 """Persistence layer for question storage and retrieval."""
 
+from .engine import get_engine
 from .repository import QuestionRepository
 
-__all__ = ["QuestionRepository"]
+__all__ = ["QuestionRepository", "get_engine"]
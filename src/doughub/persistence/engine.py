@@ -0,0 +1,30 @@
+"""Shared SQLAlchemy engine management."""
+
+from functools import cache
+
+from sqlalchemy import Engine, create_engine
+
+from doughub import config
+
+
+@cache
+def _engine_for_url(url: str) -> Engine:
+    """Create the engine for a database URL (memoized per URL)."""
+    return create_engine(url, pool_pre_ping=True)
+
+
+def get_engine(url: str | None = None) -> Engine:
+    """Get the process-wide engine for a database URL.
+
+    Engines are created once per URL and reused, so callers share one
+    connection pool instead of paying connect and dialect setup each time.
+    Close sessions to return connections to the pool; do not dispose the
+    shared engine.
+
+    Args:
+        url: Database URL. Defaults to config.DATABASE_URL.
+
+    Returns:
+        The shared Engine for the URL.
+    """
+    return _engine_for_url(url or config.DATABASE_URL)
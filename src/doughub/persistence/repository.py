@@ -2,14 +2,16 @@
 
 import json
 import logging
+from collections.abc import Iterator
 from pathlib import Path
 from typing import Any
 
-from sqlalchemy import select
-from sqlalchemy.orm import Session
+from sqlalchemy import Row, func, select, update
+from sqlalchemy.orm import Session, selectinload
 
 from doughub import config
 from doughub.models import Media, Question, Source
+from doughub.notebook.io import write_note_file
 
 logger = logging.getLogger(__name__)
 
@@ -162,6 +164,59 @@ class QuestionRepository:
         stmt = select(Question).where(Question.question_id == question_id)
         return self.session.execute(stmt).scalar_one_or_none()
 
+    def get_question_summary(
+        self, question_id: int, preview_chars: int = 200
+    ) -> Row[Any] | None:
+        """Retrieve display fields for a question without loading full rows.
+
+        Only the columns needed for a summary are selected, and the large
+        HTML and metadata columns are truncated by the database, so big
+        questions are never transferred in full.
+
+        Args:
+            question_id: Primary key of the question.
+            preview_chars: Number of characters kept from raw_html and
+                raw_metadata_json.
+
+        Returns:
+            A row with source_name, source_question_key, status, created_at,
+            updated_at, extraction_path, html_preview and metadata_preview,
+            or None if not found.
+        """
+        stmt = (
+            select(
+                Source.name.label("source_name"),
+                Question.source_question_key,
+                Question.status,
+                Question.created_at,
+                Question.updated_at,
+                Question.extraction_path,
+                func.substr(Question.raw_html, 1, preview_chars).label("html_preview"),
+                func.substr(Question.raw_metadata_json, 1, preview_chars).label(
+                    "metadata_preview"
+                ),
+            )
+            .join(Source, Source.source_id == Question.source_id)
+            .where(Question.question_id == question_id)
+        )
+        return self.session.execute(stmt).one_or_none()
+
+    def get_media_summaries(self, question_id: int) -> list[Row[Any]]:
+        """Retrieve role, MIME type and path for each media file of a question.
+
+        Args:
+            question_id: Primary key of the question.
+
+        Returns:
+            Rows with media_role, mime_type and relative_path, in ID order.
+        """
+        stmt = (
+            select(Media.media_role, Media.mime_type, Media.relative_path)
+            .where(Media.question_id == question_id)
+            .order_by(Media.media_id)
+        )
+        return list(self.session.execute(stmt).all())
+
     def get_question_by_source_key(
         self, source_id: int, source_question_key: str
     ) -> Question | None:
@@ -180,21 +235,60 @@ class QuestionRepository:
         )
         return self.session.execute(stmt).scalar_one_or_none()
 
-    def get_all_questions(self, source_id: int | None = None) -> list[Question]:
-        """Retrieve all questions, optionally filtered by source.
+    def get_questions(
+        self, *, limit: int | None = None, source_id: int | None = None
+    ) -> list[Question]:
+        """Retrieve questions, optionally filtered by source and limited.
+
+        The limit is applied in SQL, so only the requested rows are fetched
+        and hydrated.
 
         Args:
+            limit: Optional maximum number of questions to return.
             source_id: Optional source ID to filter by.
 
         Returns:
-            List of Question instances.
+            List of Question instances ordered by ID.
+        """
+        stmt = select(Question).order_by(Question.question_id)
+        if source_id is not None:
+            stmt = stmt.where(Question.source_id == source_id)
+        if limit is not None:
+            stmt = stmt.limit(limit)
+
+        return list(self.session.execute(stmt).scalars())
+
+    def iter_questions(self, *, source_id: int | None = None) -> Iterator[Question]:
+        """Stream questions, optionally filtered by source.
+
+        Rows are fetched and hydrated in batches of 1000, so the whole table
+        is never held in memory at once. Finish iterating before issuing
+        other queries on the same session.
+
+        Args:
+            source_id: Optional source ID to filter by.
+
+        Yields:
+            Question instances ordered by ID.
         """
-        stmt = select(Question)
+        stmt = select(Question).order_by(Question.question_id)
         if source_id is not None:
             stmt = stmt.where(Question.source_id == source_id)
 
-        result = self.session.execute(stmt)
-        return list(result.scalars().all())
+        yield from self.session.execute(
+            stmt.execution_options(yield_per=1000)
+        ).scalars()
+
+    def get_all_questions(self, source_id: int | None = None) -> list[Question]:
+        """Retrieve all questions, optionally filtered by source.
+
+        Args:
+            source_id: Optional source ID to filter by.
+
+        Returns:
+            List of Question instances.
+        """
+        return self.get_questions(source_id=source_id)
 
     def get_source_by_name(self, name: str) -> Source | None:
         """Retrieve a source by its name.
@@ -244,6 +338,76 @@ class QuestionRepository:
         logger.debug(f"Updated metadata for question {question_id}")
         return True
 
+    def bulk_update_from_metadata(self, metadata_list: list[dict[str, Any]]) -> int:
+        """Update many questions' metadata fields in one batch.
+
+        Bulk counterpart of update_question_from_metadata. Existing question
+        IDs are checked with one query, then all tags/state changes are sent
+        as a single executemany UPDATE. Entries without a question_id or for
+        unknown questions are skipped; later entries for the same question
+        override earlier ones.
+
+        Args:
+            metadata_list: Parsed frontmatter dictionaries, each containing
+                          'question_id' and optionally 'tags' and 'state'.
+
+        Returns:
+            Number of questions updated.
+        """
+        updates: dict[int, dict[str, Any]] = {}
+        for metadata in metadata_list:
+            question_id = metadata.get("question_id")
+            if question_id is None:
+                logger.warning("Cannot update question: missing question_id in metadata")
+                continue
+
+            values = updates.setdefault(question_id, {})
+            if "tags" in metadata:
+                values["tags"] = _serialize_tags(metadata["tags"])
+            if "state" in metadata:
+                state_value = metadata["state"]
+                values["state"] = str(state_value) if state_value is not None else None
+
+        if not updates:
+            return 0
+
+        existing = set(
+            self.session.scalars(
+                select(Question.question_id).where(
+                    Question.question_id.in_(updates.keys())
+                )
+            )
+        )
+        for question_id in updates.keys() - existing:
+            logger.warning(f"Question {question_id} not found for metadata update")
+
+        rows = [
+            {"question_id": question_id, **values}
+            for question_id, values in updates.items()
+            if question_id in existing and values
+        ]
+        if rows:
+            self.session.execute(update(Question), rows)
+
+        logger.debug(f"Updated metadata for {len(existing)} question(s)")
+        return len(existing)
+
+    def set_note_path(self, question_id: int, note_path: str) -> None:
+        """Set a question's note path with a single UPDATE statement.
+
+        Avoids loading the question and flushing the unit of work for a
+        one-column change; any copy already in the session is kept in sync.
+
+        Args:
+            question_id: ID of the question to update.
+            note_path: Path to the question's note file.
+        """
+        self.session.execute(
+            update(Question)
+            .where(Question.question_id == question_id)
+            .values(note_path=note_path)
+        )
+
     def commit(self) -> None:
         """Commit the current transaction."""
         self.session.commit()
@@ -279,6 +443,73 @@ class QuestionRepository:
             logger.debug(f"Note already exists for question {question_id}: {question.note_path}")
             return question.note_path
 
+        # Create the stub note and record its path
+        note_path = self._write_stub_note(question)
+        self.set_note_path(question_id, note_path)
+
+        logger.info(f"Created note for question {question_id}: {note_path}")
+        return note_path
+
+    def ensure_notes_for_questions(self, question_ids: list[int]) -> dict[int, str]:
+        """Ensure note files exist for several questions at once.
+
+        Batch counterpart of ensure_note_for_question: questions and their
+        sources are loaded with one query each, missing stub notes are
+        written, and all note_path updates are flushed together.
+
+        Args:
+            question_ids: IDs of the questions to create notes for.
+
+        Returns:
+            Mapping of question ID to note file path. Questions that don't
+            exist are omitted.
+
+        Raises:
+            OSError: If note file creation fails.
+        """
+        if not question_ids:
+            return {}
+
+        stmt = (
+            select(Question)
+            .options(selectinload(Question.source))
+            .where(Question.question_id.in_(question_ids))
+        )
+        questions = self.session.execute(stmt).scalars().all()
+
+        note_paths: dict[int, str] = {}
+        created = 0
+        for question in questions:
+            if question.note_path and Path(question.note_path).exists():
+                note_paths[question.question_id] = question.note_path
+                continue
+
+            question.note_path = self._write_stub_note(question)
+            note_paths[question.question_id] = question.note_path
+            created += 1
+
+        missing = set(question_ids) - note_paths.keys()
+        if missing:
+            logger.warning(f"Questions not found: {sorted(missing)}")
+
+        self.session.flush()
+        logger.info(f"Created {created} note(s) for {len(note_paths)} question(s)")
+        return note_paths
+
+    def _write_stub_note(self, question: Question) -> str:
+        """Write a stub markdown note with YAML frontmatter for a question.
+
+        Args:
+            question: The question to create a note for.
+
+        Returns:
+            Absolute path to the written note file.
+
+        Raises:
+            OSError: If note file creation fails.
+        """
+        question_id = question.question_id
+
         # Create notes directory if it doesn't exist
         notes_dir = Path(config.NOTES_DIR)
         notes_dir.mkdir(parents=True, exist_ok=True)
@@ -319,18 +550,13 @@ class QuestionRepository:
             frontmatter_lines.append("")  # Blank line after frontmatter
 
             # Write the stub note
-            with open(note_path, "w", encoding="utf-8") as f:
-                f.write("\n".join(frontmatter_lines))
-                f.write("\n\n# Notes\n\n")
-                f.write("<!-- Add your notes here -->\n")
-
-            # Update the question's note_path
-            question.note_path = str(note_path.absolute())
-            self.session.flush()
-
-            logger.info(f"Created note for question {question_id}: {note_path}")
-            return str(note_path.absolute())
-
+            write_note_file(
+                note_path,
+                "\n".join(frontmatter_lines)
+                + "\n\n# Notes\n\n<!-- Add your notes here -->\n",
+            )
         except OSError as e:
             logger.error(f"Failed to create note file for question {question_id}: {e}")
             raise
+
+        return str(note_path.absolute())
@@ -37,6 +37,23 @@ class AnkiProcessManager:
         self.profile = profile
         self.url = url
         self.process: subprocess.Popen | None = None
+        self._client: httpx.Client | None = None
+
+    def _get_client(self) -> httpx.Client:
+        """Return the shared HTTP client, creating it on first use.
+
+        Reusing one client keeps the connection to AnkiConnect alive across
+        repeated probes instead of opening a new socket for each check.
+        """
+        if self._client is None:
+            self._client = httpx.Client(timeout=2.0)
+        return self._client
+
+    def close(self) -> None:
+        """Close the shared HTTP client if it was created."""
+        if self._client is not None:
+            self._client.close()
+            self._client = None
 
     def is_ankiconnect_running(self) -> bool:
         """Check if AnkiConnect is accessible.
@@ -45,12 +62,11 @@ class AnkiProcessManager:
             True if AnkiConnect responds to requests, False otherwise.
         """
         try:
-            with httpx.Client(timeout=2.0) as client:
-                response = client.post(
-                    self.url, json={"action": "version", "version": 6}
-                )
-                data = response.json()
-                return data.get("error") is None
+            response = self._get_client().post(
+                self.url, json={"action": "version", "version": 6}
+            )
+            data = response.json()
+            return data.get("error") is None
         except Exception:
             return False
 
@@ -83,13 +99,16 @@ class AnkiProcessManager:
                 stderr=subprocess.DEVNULL,
             )
 
-            # Wait for AnkiConnect to become available
-            start_time = time.time()
-            while time.time() - start_time < timeout:
+            # Wait for AnkiConnect to become available, probing quickly at
+            # first and backing off so a fast startup is noticed promptly
+            deadline = time.monotonic() + timeout
+            delay = 0.05
+            while time.monotonic() < deadline:
                 if self.is_ankiconnect_running():
                     logger.info("Anki launched successfully and AnkiConnect is running")
                     return True
-                time.sleep(0.5)
+                time.sleep(min(delay, max(deadline - time.monotonic(), 0.0)))
+                delay = min(delay * 1.5, 1.0)
 
             logger.error(
                 f"AnkiConnect did not become available within {timeout} seconds"
@@ -130,3 +149,4 @@ class AnkiProcessManager:
     def __exit__(self, *args: Any) -> None:
         """Context manager exit."""
         self.stop_anki()
+        self.close()
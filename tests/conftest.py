@@ -34,8 +34,10 @@ def anki_manager() -> Generator[AnkiProcessManager, None, None]:
     if not manager.is_ankiconnect_running():
         success = manager.launch_anki(timeout=15.0)
         if not success:
+            manager.close()
             pytest.skip("Anki could not be started and is not running")
     yield manager
+    manager.close()
     # Note: We don't stop Anki after tests to avoid disrupting user's workflow
 
 
@@ -1,13 +1,17 @@
 """Unit tests for AnkiConnect client with mocked HTTP responses."""
 
+import json
 from collections.abc import Generator
+from unittest.mock import patch
 
 import pytest
 import respx
+from click.testing import CliRunner
 from httpx import Response
 from respx import MockRouter
 
 from doughub.anki_client import AnkiConnectClient
+from doughub.anki_client.cli import cli
 from doughub.exceptions import (
     AnkiConnectAPIError,
     AnkiConnectConnectionError,
@@ -357,3 +361,305 @@ def test_context_manager(mock_ankiconnect: MockRouter) -> None:
         version = client.get_version()
         assert version == 6
     # Client should be closed after exiting context
+
+
+def test_batch_success(mock_ankiconnect: MockRouter, client: AnkiConnectClient) -> None:
+    """Test invoking several actions in one multi request."""
+    route = mock_ankiconnect.post("/").mock(
+        return_value=Response(
+            200,
+            json={
+                "result": [
+                    {"result": ["Default"], "error": None},
+                    {"result": {"Default": 1}, "error": None},
+                ],
+                "error": None,
+            },
+        )
+    )
+
+    deck_names, decks = client.api.batch([("deckNames", {}), ("deckNamesAndIds", {})])
+    assert deck_names == ["Default"]
+    assert decks == {"Default": 1}
+    assert route.call_count == 1
+
+
+def test_batch_call_error(mock_ankiconnect: MockRouter, client: AnkiConnectClient) -> None:
+    """Test that a failing call inside a multi request raises."""
+    mock_ankiconnect.post("/").mock(
+        return_value=Response(
+            200,
+            json={
+                "result": [
+                    {"result": ["Default"], "error": None},
+                    {"result": None, "error": "model was not found: Missing"},
+                ],
+                "error": None,
+            },
+        )
+    )
+
+    with pytest.raises(AnkiConnectAPIError) as exc_info:
+        client.api.batch(
+            [("deckNames", {}), ("modelFieldNames", {"modelName": "Missing"})]
+        )
+    assert exc_info.value.action == "modelFieldNames"
+
+
+def test_get_note_types_batches_field_lookups(mock_ankiconnect: MockRouter, client: AnkiConnectClient) -> None:
+    """Test that field names for all note types are fetched in one multi request."""
+    route = mock_ankiconnect.post("/").mock(
+        return_value=Response(
+            200,
+            json={
+                "result": [
+                    {"result": ["Front", "Back"], "error": None},
+                    {"result": ["Text", "Extra"], "error": None},
+                ],
+                "error": None,
+            },
+        )
+    )
+
+    note_types = client.get_note_types(names_and_ids={"Basic": 1, "Cloze": 2})
+    assert [(nt.name, nt.id, nt.fields) for nt in note_types] == [
+        ("Basic", 1, ["Front", "Back"]),
+        ("Cloze", 2, ["Text", "Extra"]),
+    ]
+    assert route.call_count == 1
+    assert json.loads(route.calls[0].request.content)["action"] == "multi"
+
+
+def test_get_note_types_without_fields(mock_ankiconnect: MockRouter, client: AnkiConnectClient) -> None:
+    """Test that skipping fields avoids any field lookups."""
+    route = mock_ankiconnect.post("/").mock(
+        return_value=Response(200, json={"result": {"Basic": 1}, "error": None})
+    )
+
+    note_types = client.get_note_types(include_fields=False)
+    assert [(nt.name, nt.id, nt.fields) for nt in note_types] == [("Basic", 1, [])]
+    assert route.call_count == 1
+
+
+def test_iter_notes_in_deck_batches(mock_ankiconnect: MockRouter, client: AnkiConnectClient) -> None:
+    """Test that deck notes are fetched and yielded one batch at a time."""
+    requests_seen: list[dict] = []
+
+    def respond(request):
+        body = json.loads(request.content)
+        requests_seen.append(body)
+        if body["action"] == "findNotes":
+            return Response(200, json={"result": [1, 2, 3], "error": None})
+        result = [
+            {"noteId": nid, "modelName": "Basic", "fields": {}, "tags": [], "cards": []}
+            for nid in body["params"]["notes"]
+        ]
+        return Response(200, json={"result": result, "error": None})
+
+    mock_ankiconnect.post("/").mock(side_effect=respond)
+
+    notes = client.iter_notes_in_deck("Default", batch_size=2)
+    assert next(notes).note_id == 1
+    # Only the first batch has been requested so far
+    assert len(requests_seen) == 2
+    assert [note.note_id for note in notes] == [2, 3]
+    assert [body["params"]["notes"] for body in requests_seen[1:]] == [[1, 2], [3]]
+
+
+def test_model_fields_are_cached(mock_ankiconnect: MockRouter, client: AnkiConnectClient) -> None:
+    """Test that repeated field lookups reuse the cached result until invalidated."""
+    route = mock_ankiconnect.post("/").mock(
+        return_value=Response(200, json={"result": ["Front", "Back"], "error": None})
+    )
+
+    assert client.get_model_fields("Basic") == ["Front", "Back"]
+    assert client.get_model_field_names("Basic") == ["Front", "Back"]
+    assert route.call_count == 1
+
+    client.invalidate()
+    client.get_model_fields("Basic")
+    assert route.call_count == 2
+
+
+def test_update_note_and_get_single_request(mock_ankiconnect: MockRouter, client: AnkiConnectClient) -> None:
+    """Test that updating a note and reading it back is one multi request."""
+    note_info = {
+        "noteId": 42,
+        "modelName": "Basic",
+        "fields": {"Front": {"value": "New", "order": 0}},
+        "tags": [],
+        "cards": [7],
+    }
+    route = mock_ankiconnect.post("/").mock(
+        return_value=Response(
+            200,
+            json={
+                "result": [
+                    {"result": None, "error": None},
+                    {"result": [note_info], "error": None},
+                ],
+                "error": None,
+            },
+        )
+    )
+
+    note = client.update_note_and_get(42, {"Front": "New"})
+    assert note.note_id == 42
+    assert note.fields["Front"] == "New"
+    assert route.call_count == 1
+
+
+def test_update_note_and_get_not_found(mock_ankiconnect: MockRouter, client: AnkiConnectClient) -> None:
+    """Test that a failed update inside the multi request maps to NoteNotFoundError."""
+    mock_ankiconnect.post("/").mock(
+        return_value=Response(
+            200,
+            json={
+                "result": [
+                    {"result": None, "error": "note was not found: 42"},
+                    {"result": [{}], "error": None},
+                ],
+                "error": None,
+            },
+        )
+    )
+
+    with pytest.raises(NoteNotFoundError):
+        client.update_note_and_get(42, {"Front": "New"})
+
+
+def test_list_notes_in_decks_single_search(mock_ankiconnect: MockRouter, client: AnkiConnectClient) -> None:
+    """Test that several decks are searched with one escaped findNotes query."""
+    queries: list[str] = []
+
+    def respond(request):
+        body = json.loads(request.content)
+        if body["action"] == "findNotes":
+            queries.append(body["params"]["query"])
+        return Response(200, json={"result": [], "error": None})
+
+    mock_ankiconnect.post("/").mock(side_effect=respond)
+
+    assert client.list_notes_in_decks(["Default", 'Say "hi"']) == []
+    assert queries == ['(deck:"Default" OR deck:"Say \\"hi\\"")']
+
+
+def test_get_notes_detail_single_lookup(mock_ankiconnect: MockRouter, client: AnkiConnectClient) -> None:
+    """Test that several notes are fetched with one notesInfo call."""
+    route = mock_ankiconnect.post("/").mock(
+        return_value=Response(
+            200,
+            json={
+                "result": [
+                    {"noteId": 1, "modelName": "Basic", "fields": {}, "tags": [], "cards": []},
+                    {},
+                ],
+                "error": None,
+            },
+        )
+    )
+
+    with pytest.raises(NoteNotFoundError):
+        client.get_notes_detail([1, 2])
+    assert route.call_count == 1
+
+
+def test_get_decks_with_prefetched_ids(mock_ankiconnect: MockRouter, client: AnkiConnectClient) -> None:
+    """Test building Deck objects from an already fetched mapping."""
+    # No route is mocked, so any HTTP request would fail the test
+    decks = client.get_decks(names_and_ids={"Default": 1, "Programming": 2})
+    assert {(deck.name, deck.id) for deck in decks} == {("Default", 1), ("Programming", 2)}
+
+
+def test_create_notes_batch(mock_ankiconnect: MockRouter, client: AnkiConnectClient) -> None:
+    """Test adding several notes with a single addNotes request."""
+    route = mock_ankiconnect.post("/").mock(
+        return_value=Response(200, json={"result": [1001, None], "error": None})
+    )
+
+    note_ids = client.create_notes(
+        [
+            {"deck": "Default", "model": "Basic", "fields": {"Front": "Q1", "Back": "A1"}},
+            {"deck": "Default", "model": "Basic", "fields": {"Front": "Q2", "Back": "A2"}, "tags": ["t"]},
+        ]
+    )
+
+    assert note_ids == [1001, None]
+    assert route.call_count == 1
+    payload = json.loads(route.calls.last.request.content)
+    assert payload["action"] == "addNotes"
+    assert [note["tags"] for note in payload["params"]["notes"]] == [[], ["t"]]
+
+
+def test_get_notes_info_chunks_large_requests(mock_ankiconnect: MockRouter, client: AnkiConnectClient) -> None:
+    """Test that large notesInfo lookups are split and reassembled in order."""
+
+    def notes_info(request):  # type: ignore[no-untyped-def]
+        note_ids = json.loads(request.content)["params"]["notes"]
+        result = [
+            {"noteId": note_id, "modelName": "Basic", "tags": [], "fields": {}, "cards": []}
+            for note_id in note_ids
+        ]
+        return Response(200, json={"result": result, "error": None})
+
+    route = mock_ankiconnect.post("/").mock(side_effect=notes_info)
+
+    note_ids = list(range(1, 1201))
+    notes = client.get_notes_info(note_ids)
+
+    assert [note.note_id for note in notes] == note_ids
+    assert route.call_count == 3
+
+
+def test_cli_creates_repository_lazily() -> None:
+    """Test that the CLI only opens an AnkiConnect client when a command needs it."""
+    with patch("doughub.anki_client.cli.AnkiRepository") as repo_cls:
+        result = CliRunner().invoke(cli, ["--help"])
+        assert result.exit_code == 0
+        repo_cls.assert_not_called()
+
+        result = CliRunner().invoke(cli, ["check-connection"])
+        assert result.exit_code == 0
+        repo_cls.assert_called_once()
+        repo_cls.return_value.close.assert_called_once()
+
+
+def test_cli_rejects_malformed_field_argument() -> None:
+    """Test that a --field value without '=' is rejected before contacting Anki."""
+    with patch("doughub.anki_client.cli.AnkiRepository") as repo_cls:
+        result = CliRunner().invoke(cli, ["edit-note", "--id", "1", "--field", "Front"])
+        assert result.exit_code == 1
+        assert "Expected 'FieldName=value'" in result.output
+        repo_cls.assert_not_called()
+
+
+def test_cli_add_notes_batches_json_lines() -> None:
+    """Test that add-notes sends JSON Lines input to Anki in batches."""
+    lines = "\n".join(
+        json.dumps({"deck": "Default", "model": "Basic", "fields": {"Front": str(i)}})
+        for i in range(3)
+    )
+    with patch("doughub.anki_client.cli.AnkiRepository") as repo_cls:
+        repo = repo_cls.return_value
+        repo.create_notes.side_effect = [[101, None], [103]]
+
+        result = CliRunner().invoke(cli, ["add-notes", "--batch-size", "2"], input=lines)
+
+    assert result.exit_code == 1
+    assert [len(call.args[0]) for call in repo.create_notes.call_args_list] == [2, 1]
+    assert "Line 1: created note 101" in result.output
+    assert "Created 2 note(s), 1 failed" in result.output
+
+
+def test_cli_launch_anki_closes_probe_client() -> None:
+    """Test that launch-anki releases the process manager's HTTP client."""
+    with patch("doughub.anki_client.cli.AnkiProcessManager") as manager_cls:
+        manager = manager_cls.return_value
+        manager.is_ankiconnect_running.return_value = False
+        manager.launch_anki.return_value = False
+
+        result = CliRunner().invoke(cli, ["launch-anki", "--timeout", "1"])
+
+    assert result.exit_code == 1
+    manager.close.assert_called_once()
+    manager.stop_anki.assert_not_called()
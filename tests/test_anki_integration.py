@@ -32,8 +32,10 @@ def anki_manager() -> Generator[AnkiProcessManager, None, None]:
     if not manager.is_ankiconnect_running():
         success = manager.launch_anki(timeout=15.0)
         if not success:
+            manager.close()
             pytest.skip("Anki could not be started and is not running")
     yield manager
+    manager.close()
     # Note: We don't stop Anki after tests to avoid disrupting user's workflow
     # If you want to stop Anki after tests, uncomment the next line:
     # manager.stop_anki()
@@ -339,7 +341,7 @@ class TestAnkiFailures:
         """Test handling of invalid JSON response."""
         mock_client = mock_client_cls.return_value
         mock_response = Mock()
-        mock_response.json.side_effect = ValueError("Invalid JSON")
+        mock_response.content = b"<html>Invalid JSON</html>"
         mock_client.post.return_value = mock_response
 
         client = AnkiConnectClient()
@@ -352,7 +354,7 @@ class TestAnkiFailures:
         """Test handling of response missing 'error' field."""
         mock_client = mock_client_cls.return_value
         mock_response = Mock()
-        mock_response.json.return_value = {"result": 6}  # Missing 'error'
+        mock_response.content = b'{"result": 6}'  # Missing 'error'
         mock_client.post.return_value = mock_response
 
         client = AnkiConnectClient()
@@ -365,7 +367,7 @@ class TestAnkiFailures:
         """Test handling of API error response."""
         mock_client = mock_client_cls.return_value
         mock_response = Mock()
-        mock_response.json.return_value = {"result": None, "error": "Some API Error"}
+        mock_response.content = b'{"result": null, "error": "Some API Error"}'
         mock_client.post.return_value = mock_response
 
         client = AnkiConnectClient()
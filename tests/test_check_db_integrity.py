@@ -0,0 +1,78 @@
+"""Tests for the database integrity check script."""
+
+import os
+import sys
+from pathlib import Path
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import Session
+
+# Add scripts directory to path to import check_db_integrity
+sys.path.append(str(Path(__file__).parents[1] / "scripts"))
+
+from check_db_integrity import _collect_disk_paths, scan_media  # type: ignore
+
+from doughub.models import Base, Media, Question, Source
+
+
+@pytest.fixture
+def media_root(tmp_path: Path) -> Path:
+    """Create a media tree reached partly through symlinks."""
+    root = tmp_path / "media"
+    (root / "img").mkdir(parents=True)
+    (root / "img" / "a.png").write_bytes(b"a")
+
+    shared = tmp_path / "shared"
+    shared.mkdir()
+    (shared / "b.png").write_bytes(b"b")
+    (root / "linked").symlink_to(shared, target_is_directory=True)
+    (root / "img" / "c.png").symlink_to(root / "img" / "a.png")
+    # A cycle back to the root must not be walked forever
+    (root / "img" / "loop").symlink_to(root, target_is_directory=True)
+    return root
+
+
+def test_collect_disk_paths_follows_symlinks(media_root: Path) -> None:
+    """Test that files behind symlinked files and directories are collected."""
+    paths = _collect_disk_paths(media_root)
+    assert {"img/a.png", "img/c.png", "linked/b.png"} <= paths
+
+
+def test_scan_media_resolves_unlisted_paths(media_root: Path) -> None:
+    """Test that only truly missing files are reported."""
+    engine = create_engine("sqlite:///:memory:")
+    Base.metadata.create_all(engine)
+    with Session(engine) as session:
+        source = Source(name="Bank")
+        session.add(source)
+        session.flush()
+        question = Question(
+            source_id=source.source_id,
+            source_question_key="q1",
+            raw_html="<p>Q</p>",
+            raw_metadata_json="{}",
+        )
+        session.add(question)
+        session.flush()
+        for path in (
+            "img/a.png",
+            "linked/b.png",
+            "./img/c.png",
+            f"img/..{os.sep}img/a.png",
+            "img/missing.png",
+        ):
+            session.add(
+                Media(
+                    question_id=question.question_id,
+                    media_role="image",
+                    mime_type="image/png",
+                    relative_path=path,
+                )
+            )
+        session.commit()
+
+        errors = scan_media(session, media_root)
+
+    assert len(errors) == 1
+    assert "path=img/missing.png" in errors[0]
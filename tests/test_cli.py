@@ -0,0 +1,306 @@
+"""Tests for the doughub command-line interface."""
+
+import json
+from collections.abc import Generator
+from contextlib import contextmanager
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import Session
+from typer.testing import CliRunner
+
+from doughub import __version__
+from doughub.cli import app
+from doughub.models import Base, Media, Question, Source
+from doughub.notebook.sync import _parse_note_frontmatter
+from doughub.persistence import get_engine
+
+runner = CliRunner()
+
+
+@pytest.fixture
+def database(tmp_path: Path) -> Generator[str, None, None]:
+    """Point the CLI at a temporary SQLite database with sample data."""
+    url = f"sqlite:///{tmp_path / 'cli.db'}"
+    engine = get_engine(url)
+    Base.metadata.create_all(engine)
+
+    with Session(engine) as session:
+        source = Source(name="Bank A", description="First bank")
+        session.add_all([source, Source(name="Bank B")])
+        session.flush()
+        for key in ("q1", "q2"):
+            question = Question(
+                source_id=source.source_id,
+                source_question_key=key,
+                raw_html="<p>Question</p>",
+                raw_metadata_json="{}",
+            )
+            session.add(question)
+        session.flush()
+        session.add(
+            Media(
+                question_id=question.question_id,
+                media_role="image",
+                mime_type="image/png",
+                relative_path="img/q2.png",
+            )
+        )
+        session.commit()
+
+    with patch("doughub.config.DATABASE_URL", url):
+        yield url
+    engine.dispose()
+
+
+@contextmanager
+def capture_statements(engine: Engine) -> Generator[list[str], None, None]:
+    """Record the SQL statements executed on an engine inside the block."""
+    statements: list[str] = []
+
+    def record(conn, cursor, statement, parameters, context, executemany) -> None:
+        statements.append(statement)
+
+    event.listen(engine, "before_cursor_execute", record)
+    try:
+        yield statements
+    finally:
+        event.remove(engine, "before_cursor_execute", record)
+
+
+def test_version_option() -> None:
+    """Test that --version prints the package version."""
+    result = runner.invoke(app, ["--version"])
+    assert result.exit_code == 0
+    assert result.output == f"doughub {__version__}\n"
+
+
+def test_show_question(database: str) -> None:
+    """Test showing a question with its source and media."""
+    result = runner.invoke(app, ["db", "show-question", "2"])
+    assert result.exit_code == 0
+    assert "Source:       Bank A" in result.output
+    assert "Source Key:   q2" in result.output
+    assert "image (image/png): img/q2.png" in result.output
+
+
+def test_show_question_json(database: str) -> None:
+    """Test that --json prints the question as a single JSON object."""
+    result = runner.invoke(app, ["db", "show-question", "2", "--json"])
+    assert result.exit_code == 0
+    payload = json.loads(result.output)
+    assert payload["question_id"] == 2
+    assert payload["source"] == "Bank A"
+    assert payload["html_preview"] == "<p>Question</p>"
+    assert payload["media"] == [
+        {"media_role": "image", "mime_type": "image/png", "relative_path": "img/q2.png"}
+    ]
+
+
+def test_show_question_query_count(database: str) -> None:
+    """Test that the question, its source and its media take two queries."""
+    with capture_statements(get_engine(database)) as statements:
+        result = runner.invoke(app, ["db", "show-question", "2"])
+
+    assert result.exit_code == 0
+    # Source is joined into the summary row; media is one projection query
+    assert len(statements) == 2
+    assert "JOIN sources" in statements[0]
+    assert "FROM media" in statements[1]
+
+
+def test_show_question_not_found(database: str) -> None:
+    """Test that an unknown question ID exits with an error."""
+    result = runner.invoke(app, ["db", "show-question", "99"])
+    assert result.exit_code == 1
+    assert "not found" in result.output
+
+
+def test_source_summary(database: str) -> None:
+    """Test per-source question counts and totals."""
+    result = runner.invoke(app, ["db", "source-summary"])
+    assert result.exit_code == 0
+    lines = result.output.splitlines()
+    assert any(line.startswith("Bank A") and " 2 " in line for line in lines)
+    assert any(line.startswith("Bank B") and " 0 " in line for line in lines)
+    assert "Total sources: 2" in result.output
+    assert "Total questions: 2" in result.output
+
+
+def test_source_summary_json(database: str) -> None:
+    """Test that --json prints per-source counts and totals as JSON."""
+    result = runner.invoke(app, ["db", "source-summary", "--json"])
+    assert result.exit_code == 0
+    assert json.loads(result.output) == {
+        "sources": [
+            {"name": "Bank A", "description": "First bank", "question_count": 2},
+            {"name": "Bank B", "description": None, "question_count": 0},
+        ],
+        "total_sources": 2,
+        "total_questions": 2,
+    }
+
+
+def test_source_summary_descriptions(database: str) -> None:
+    """Test that long descriptions are truncated and missing ones labelled."""
+    with Session(get_engine(database)) as session:
+        session.add(Source(name="Bank C", description="x" * 40))
+        session.commit()
+
+    result = runner.invoke(app, ["db", "source-summary"])
+    assert result.exit_code == 0
+    lines = result.output.splitlines()
+    assert any(line.endswith(" First bank") for line in lines)
+    assert any(line.endswith(" (no description)") for line in lines)
+    assert any(line.endswith(" " + "x" * 30 + "...") for line in lines)
+
+
+def test_source_summary_single_query(database: str) -> None:
+    """Test that source counts come from one query, not one per source."""
+    with capture_statements(get_engine(database)) as statements:
+        result = runner.invoke(app, ["db", "source-summary"])
+
+    assert result.exit_code == 0
+    assert len(statements) == 1
+
+
+def test_check_integrity_bulk_lookup(database: str, tmp_path: Path) -> None:
+    """Test integrity results and that note files are looked up in one query."""
+    notes_dir = tmp_path / "notes"
+    notes_dir.mkdir()
+    linked = notes_dir / "q1.md"
+    linked.write_text("---\nquestion_id: 1\n---\n", encoding="utf-8")
+    (notes_dir / "q2.md").write_text("---\nquestion_id: 2\n---\n", encoding="utf-8")
+    (notes_dir / "orphan.md").write_text("---\nquestion_id: 99\n---\n", encoding="utf-8")
+
+    engine = get_engine(database)
+    with Session(engine) as session:
+        session.get(Question, 1).note_path = str(linked)
+        session.commit()
+
+    with (
+        capture_statements(engine) as statements,
+        patch("doughub.config.NOTES_DIR", str(notes_dir)),
+    ):
+        result = runner.invoke(app, ["notebook", "check-integrity"])
+
+    assert result.exit_code == 1
+    assert "Orphaned note file: question_id=99" in result.output
+    assert "Note path mismatch: question_id=2" in result.output
+    assert "question_id=1" not in result.output
+    # One query for DB -> filesystem, one for filesystem -> DB
+    assert len(statements) == 2
+
+
+def test_check_integrity_parses_each_note_once(database: str, tmp_path: Path) -> None:
+    """Test that notes linked in the database are not re-parsed in the file scan."""
+    notes_dir = tmp_path / "notes"
+    notes_dir.mkdir()
+    linked = notes_dir / "q1.md"
+    linked.write_text("---\nquestion_id: 1\n---\n", encoding="utf-8")
+    broken = notes_dir / "broken.md"
+    broken.write_text("---\nquestion_id: [\n---\n", encoding="utf-8")
+
+    with Session(get_engine(database)) as session:
+        session.get(Question, 1).note_path = str(linked)
+        session.commit()
+
+    with (
+        patch("doughub.config.NOTES_DIR", str(notes_dir)),
+        patch(
+            "doughub.notebook.sync._parse_note_frontmatter",
+            side_effect=_parse_note_frontmatter,
+        ) as parse_mock,
+    ):
+        result = runner.invoke(app, ["notebook", "check-integrity"])
+
+    assert result.exit_code == 0
+    assert f"Failed to parse note file: {broken}" in result.output
+    assert sorted(call.args[0] for call in parse_mock.call_args_list) == [
+        str(broken),
+        str(linked),
+    ]
+
+
+def test_show_question_truncates_previews_in_sql(database: str) -> None:
+    """Test that large HTML is truncated by the database, not in Python."""
+    engine = get_engine(database)
+    with Session(engine) as session:
+        session.get(Question, 1).raw_html = "x" * 10_000
+        session.commit()
+
+    with capture_statements(engine) as statements:
+        result = runner.invoke(app, ["db", "show-question", "1"])
+
+    assert result.exit_code == 0
+    assert f"HTML Preview: {'x' * 200}..." in result.output
+    assert "x" * 201 not in result.output
+    assert "substr(questions.raw_html" in statements[0]
+    assert "No media files" in result.output
+
+
+def test_health_check_runs_each_stage_once() -> None:
+    """Test that repeated --stage values are deduplicated and run in order."""
+    with patch("doughub.cli._run_validation_stage", return_value=True) as run_stage:
+        result = runner.invoke(
+            app, ["health-check", "--stage", "2", "--stage", "1", "--stage", "2"]
+        )
+
+    assert result.exit_code == 0
+    assert [call.args[0] for call in run_stage.call_args_list] == [1, 2]
+
+
+def test_health_check_rejects_unknown_stage() -> None:
+    """Test that an unknown stage number is reported without running anything."""
+    with patch("doughub.cli._run_validation_stage") as run_stage:
+        result = runner.invoke(app, ["health-check", "--stage", "7"])
+
+    assert result.exit_code == 2
+    assert "Unknown stage(s): 7" in result.output
+    run_stage.assert_not_called()
+
+
+def test_check_integrity_missing_notes_dir(database: str, tmp_path: Path) -> None:
+    """Test that a missing notes directory is treated as having no notes."""
+    with patch("doughub.config.NOTES_DIR", str(tmp_path / "missing")):
+        result = runner.invoke(app, ["notebook", "check-integrity"])
+
+    assert result.exit_code == 0
+    assert "No issues found" in result.output
+
+
+def test_check_integrity_invalid_question_id(database: str, tmp_path: Path) -> None:
+    """Test that a non-integer question_id is a per-file warning."""
+    notes_dir = tmp_path / "notes"
+    notes_dir.mkdir()
+    bad = notes_dir / "bad.md"
+    bad.write_text("---\nquestion_id: [1, 2]\n---\n", encoding="utf-8")
+    (notes_dir / "orphan.md").write_text("---\nquestion_id: 99\n---\n", encoding="utf-8")
+
+    with patch("doughub.config.NOTES_DIR", str(notes_dir)):
+        result = runner.invoke(app, ["notebook", "check-integrity"])
+
+    assert result.exit_code == 1
+    assert f"Failed to parse note file: {bad}" in result.output
+    assert "Orphaned note file: question_id=99" in result.output
+
+
+def test_check_integrity_string_question_id(database: str, tmp_path: Path) -> None:
+    """Test that a quoted numeric question_id matches its question."""
+    notes_dir = tmp_path / "notes"
+    notes_dir.mkdir()
+    note = notes_dir / "q1.md"
+    note.write_text('---\nquestion_id: "1"\n---\n', encoding="utf-8")
+
+    with Session(get_engine(database)) as session:
+        session.get(Question, 1).note_path = str(note)
+        session.commit()
+
+    with patch("doughub.config.NOTES_DIR", str(notes_dir)):
+        result = runner.invoke(app, ["notebook", "check-integrity"])
+
+    assert result.exit_code == 0
+    assert "Orphaned" not in result.output
@@ -0,0 +1,155 @@
+"""Tests for the extraction server's HTTP endpoints."""
+
+import sys
+from collections import deque
+from collections.abc import Generator
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+from flask.testing import FlaskClient
+
+# Add scripts directory to path to import extraction_server
+sys.path.append(str(Path(__file__).parents[1] / "scripts"))
+
+import extraction_server  # type: ignore
+
+EXTRACTION = {
+    "timestamp": "2025-01-01T00:00:00Z",
+    "url": "https://example.com/q/1",
+    "hostname": "example.com",
+    "siteName": "Example",
+    "elementCount": 1,
+    "pageHTML": "<html><body>Question</body></html>",
+    "bodyText": "Question",
+    "elements": [],
+}
+
+
+@pytest.fixture
+def client(tmp_path: Path) -> Generator[FlaskClient, None, None]:
+    """Serve the extraction app with files in a temporary directory."""
+    extraction_server.extractions.clear()
+    with (
+        patch.object(extraction_server, "OUTPUT_DIR", tmp_path),
+        patch.object(
+            extraction_server, "persist_to_database", return_value=(True, None)
+        ),
+    ):
+        yield extraction_server.app.test_client()
+    extraction_server.extractions.clear()
+
+
+def test_files_complete_before_reply(client: FlaskClient, tmp_path: Path) -> None:
+    """Test that saved files are fully written when the reply is sent."""
+    response = client.post("/extract", json=EXTRACTION)
+    assert response.status_code == 200
+
+    files = response.get_json()["files"]
+    assert Path(files["html"]).read_text(encoding="utf-8") == EXTRACTION["pageHTML"]
+    assert Path(files["json"]).exists()
+    assert not list(tmp_path.glob("*.tmp"))
+
+
+def test_write_failure_reported(client: FlaskClient) -> None:
+    """Test that a failed file write returns an error and is not listed."""
+    with patch.object(
+        extraction_server, "_write_file", side_effect=OSError("disk full")
+    ):
+        response = client.post("/extract", json=EXTRACTION)
+
+    assert response.status_code == 500
+    assert "disk full" in response.get_json()["error"]
+    assert client.get("/extractions").get_json()["total"] == 0
+
+
+def test_get_extraction_by_counter_after_eviction(client: FlaskClient) -> None:
+    """Test that extractions keep their counter index once older ones are evicted."""
+    with patch.object(extraction_server, "extractions", deque(maxlen=1)):
+        first = client.post("/extract", json=EXTRACTION).get_json()["index"]
+        second = client.post(
+            "/extract", json={**EXTRACTION, "url": "https://example.com/q/2"}
+        ).get_json()["index"]
+
+        assert client.get(f"/extractions/{first}").status_code == 404
+        response = client.get(f"/extractions/{second}")
+        assert response.status_code == 200
+        assert response.get_json()["url"] == "https://example.com/q/2"
+        listed = client.get("/extractions").get_json()["extractions"]
+        assert [ext["index"] for ext in listed] == [second]
+
+
+def test_get_extraction_with_corrupt_json(client: FlaskClient) -> None:
+    """Test that an unreadable JSON file is reported as unavailable."""
+    posted = client.post("/extract", json=EXTRACTION).get_json()
+    Path(posted["files"]["json"]).write_text('{"url": ', encoding="utf-8")
+
+    response = client.get(f"/extractions/{posted['index']}")
+    assert response.status_code == 404
+    assert "not available" in response.get_json()["error"]
+
+
+def test_download_images_fetches_duplicate_urls_once() -> None:
+    """Test that a repeated URL is downloaded once and reused in input order."""
+    images = [
+        {"url": "https://example.com/a.png", "title": "first"},
+        {"url": "https://example.com/b.png", "title": "other"},
+        {"url": "https://example.com/a.png", "title": "again"},
+    ]
+
+    def fake_download(idx, img, base_filename, total):
+        return {
+            "index": idx,
+            "url": img["url"],
+            "local_path": f"/tmp/{base_filename}_img{idx}.png",
+            "title": img["title"],
+            "type": "image",
+        }
+
+    with patch.object(
+        extraction_server, "_download_image", side_effect=fake_download
+    ) as download:
+        results = extraction_server.download_images(images, "base")
+
+    assert download.call_count == 2
+    assert [r["index"] for r in results] == [0, 1, 2]
+    assert [r["title"] for r in results] == ["first", "other", "again"]
+    assert results[2]["local_path"] == results[0]["local_path"] == "/tmp/base_img0.png"
+
+
+def test_download_images_propagates_failed_duplicate() -> None:
+    """Test that a failed download yields an error entry for every duplicate."""
+    images = [
+        {"url": "https://example.com/broken.png"},
+        {"url": "https://example.com/broken.png"},
+    ]
+    failure = {"index": 0, "url": images[0]["url"], "error": "404 Not Found"}
+
+    with patch.object(
+        extraction_server, "_download_image", return_value=failure
+    ) as download:
+        results = extraction_server.download_images(images, "base")
+
+    download.assert_called_once()
+    assert results == [
+        {"index": 0, "url": images[0]["url"], "error": "404 Not Found"},
+        {"index": 1, "url": images[0]["url"], "error": "404 Not Found"},
+    ]
+
+
+def test_oversized_payload_rejected(client: FlaskClient) -> None:
+    """Test that a body over the size limit gets a 413 JSON error."""
+    with patch.object(extraction_server, "MAX_EXTRACTION_BYTES", 64):
+        response = client.post("/extract", json=EXTRACTION)
+
+    assert response.status_code == 413
+    assert response.get_json() == {"error": "Payload too large"}
+
+
+def test_oversized_payload_rejected_while_reading(client: FlaskClient) -> None:
+    """Test that Flask's own size limit also yields a 413 JSON error."""
+    with patch.dict(extraction_server.app.config, {"MAX_CONTENT_LENGTH": 64}):
+        response = client.post("/extract", json=EXTRACTION)
+
+    assert response.status_code == 413
+    assert response.get_json() == {"error": "Payload too large"}
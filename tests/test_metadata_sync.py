@@ -1,13 +1,19 @@
 """Tests for metadata sync functionality (Phase 3)."""
 
+import os
 from pathlib import Path
+from unittest.mock import patch
 
 import pytest
 from sqlalchemy import create_engine
 from sqlalchemy.orm import sessionmaker
 
 from doughub.models import Base
-from doughub.notebook.sync import _parse_note_frontmatter, scan_and_parse_notes
+from doughub.notebook.sync import (
+    _frontmatter_cache,
+    _parse_note_frontmatter,
+    scan_and_parse_notes,
+)
 from doughub.persistence.repository import QuestionRepository
 
 
@@ -157,6 +163,60 @@ Content
         assert len(notes) == 2
         assert {n["question_id"] for n in notes} == {1, 3}
 
+    def test_rescan_reuses_parsed_frontmatter(self, tmp_path: Path) -> None:
+        """Test that unchanged notes are not re-parsed on a later scan."""
+        note_file = tmp_path / "note.md"
+        note_file.write_text("---\nquestion_id: 1\nstate: new\n---\nContent\n")
+        first = list(scan_and_parse_notes(tmp_path))
+
+        with patch("doughub.notebook.sync._parse_note_frontmatter") as mock_parse:
+            second = list(scan_and_parse_notes(tmp_path))
+        mock_parse.assert_not_called()
+        assert second == first
+
+        # Editing the note invalidates the cached result
+        note_file.write_text("---\nquestion_id: 1\nstate: reviewed\n---\nContent\n")
+        os.utime(note_file, ns=(0, note_file.stat().st_mtime_ns + 1_000_000_000))
+        third = list(scan_and_parse_notes(tmp_path))
+        assert third[0]["state"] == "reviewed"
+
+    def test_rescan_prunes_removed_notes_from_cache(self, tmp_path: Path) -> None:
+        """Test that notes deleted since the last scan are dropped from the cache."""
+        notes_dir = tmp_path / "notes"
+        other_dir = tmp_path / "other"
+        for directory in (notes_dir, other_dir):
+            directory.mkdir()
+            (directory / "keep.md").write_text("---\nquestion_id: 1\n---\n")
+        removed = notes_dir / "removed.md"
+        removed.write_text("---\nquestion_id: 2\n---\n")
+        list(scan_and_parse_notes(notes_dir))
+        list(scan_and_parse_notes(other_dir))
+        assert removed in _frontmatter_cache
+
+        removed.unlink()
+        list(scan_and_parse_notes(notes_dir))
+
+        assert removed not in _frontmatter_cache
+        assert notes_dir / "keep.md" in _frontmatter_cache
+        assert other_dir / "keep.md" in _frontmatter_cache
+
+    def test_scan_skips_files_too_small_for_frontmatter(self, tmp_path: Path) -> None:
+        """Test that tiny files are never opened and nested notes are found."""
+        (tmp_path / "empty.md").write_text("")
+        (tmp_path / "tiny.md").write_text("---\n")
+        nested = tmp_path / "sub" / "deeper"
+        nested.mkdir(parents=True)
+        (nested / "note.md").write_text("---\nquestion_id: 3\n---\n")
+
+        with patch(
+            "doughub.notebook.sync._parse_note_frontmatter",
+            side_effect=_parse_note_frontmatter,
+        ) as mock_parse:
+            notes = list(scan_and_parse_notes(tmp_path))
+
+        assert [note["question_id"] for note in notes] == [3]
+        assert mock_parse.call_count == 1
+
     def test_scan_nonexistent_directory(self, tmp_path: Path) -> None:
         """Test scanning a directory that doesn't exist."""
         nonexistent = tmp_path / "nonexistent"
@@ -236,6 +296,42 @@ class TestRepositoryMetadataUpdate:
         assert updated is not None
         assert updated.state == "review"
 
+    def test_bulk_update_from_metadata(self, repository: QuestionRepository) -> None:
+        """Test updating several questions from metadata in one batch."""
+        source = repository.get_or_create_source("MKSAP_19")
+        questions = [
+            repository.add_question(
+                {
+                    "source_id": source.source_id,
+                    "source_question_key": key,
+                    "raw_html": "<p>Test</p>",
+                    "raw_metadata_json": "{}",
+                }
+            )
+            for key in ("Q1", "Q2")
+        ]
+        repository.commit()
+        first_id, second_id = (q.question_id for q in questions)
+
+        count = repository.bulk_update_from_metadata(
+            [
+                {"question_id": first_id, "tags": ["cardiology"]},
+                {"question_id": second_id, "state": "review"},
+                {"question_id": 99999, "tags": ["missing"]},
+                {"tags": ["no-id"]},
+            ]
+        )
+        repository.commit()
+
+        assert count == 2
+        first = repository.get_question_by_id(first_id)
+        second = repository.get_question_by_id(second_id)
+        assert first is not None and second is not None
+        assert first.tags == '["cardiology"]'
+        assert first.state is None
+        assert second.tags is None
+        assert second.state == "review"
+
     def test_update_nonexistent_question(self, repository: QuestionRepository) -> None:
         """Test updating a nonexistent question returns False."""
         metadata = {
@@ -1,5 +1,6 @@
 """Tests for NotesiumManager lifecycle and error handling."""
 
+import time
 from pathlib import Path
 from typing import Any
 from unittest.mock import Mock, patch
@@ -194,6 +195,28 @@ class TestNotesiumHealthChecks:
         # Should return False because health check fails
         assert manager.is_healthy() is False
 
+    @patch("doughub.notebook.manager.httpx.Client")
+    def test_is_healthy_reuses_recent_probe(
+        self, mock_client_cls: Mock, tmp_path: Path
+    ) -> None:
+        """Test that is_healthy() reuses a probe result within the TTL."""
+        manager = NotesiumManager(notes_dir=str(tmp_path), port=3045)
+        manager._is_healthy = True
+
+        mock_response = Mock()
+        mock_response.status_code = 200
+        mock_client = mock_client_cls.return_value.__enter__.return_value
+        mock_client.get.return_value = mock_response
+
+        assert manager.is_healthy() is True
+        assert manager.is_healthy() is True
+        assert mock_client.get.call_count == 1
+
+        # An expired probe triggers a fresh check
+        manager._last_probe = (time.monotonic() - manager.HEALTH_CACHE_TTL, True)
+        assert manager.is_healthy() is True
+        assert mock_client.get.call_count == 2
+
 
 class TestErrorConditions:
     """Test error handling in various failure scenarios."""
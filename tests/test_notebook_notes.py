@@ -318,3 +318,37 @@ class TestEdgeCases:
 
         # After closing ---, should have content
         assert closing_index < len(lines) - 1
+
+    def test_ensure_notes_for_questions_batch(self, note_repo_db: tuple[QuestionRepository, Path]) -> None:
+        """Test creating notes for several questions in one call."""
+        repo, notes_dir = note_repo_db
+
+        source = repo.get_or_create_source("TestSource")
+        question_ids = []
+        for key in ("Q010", "Q011"):
+            question = repo.add_question(
+                {
+                    "source_id": source.source_id,
+                    "source_question_key": key,
+                    "raw_html": "<p>Test</p>",
+                    "raw_metadata_json": "{}",
+                }
+            )
+            question_ids.append(int(question.question_id))
+        repo.commit()
+
+        # Pre-create one note; it should be reused, not rewritten
+        existing_path = repo.ensure_note_for_question(question_ids[0])
+        repo.commit()
+
+        note_paths = repo.ensure_notes_for_questions([*question_ids, 999999])
+        repo.commit()
+
+        assert set(note_paths) == set(question_ids)
+        assert note_paths[question_ids[0]] == existing_path
+        assert Path(note_paths[question_ids[1]]).exists()
+        assert Path(note_paths[question_ids[1]]).parent == notes_dir
+
+        updated = repo.get_question_by_id(question_ids[1])
+        assert updated is not None
+        assert updated.note_path == note_paths[question_ids[1]]
@@ -16,7 +16,7 @@ from alembic.config import Config
 from alembic import command
 
 from doughub.models import Base, Media, Question, Source
-from doughub.persistence import QuestionRepository
+from doughub.persistence import QuestionRepository, get_engine
 
 
 @pytest.fixture
@@ -254,6 +254,19 @@ class TestQuestionRepository:
         peerprep_questions = repo.get_all_questions(source_id=source2.source_id)
         assert len(peerprep_questions) == 2
 
+        # Limit is applied in SQL
+        limited = repo.get_questions(limit=2)
+        assert [q.question_id for q in limited] == [
+            q.question_id for q in all_questions[:2]
+        ]
+        assert len(repo.get_questions(limit=10, source_id=source2.source_id)) == 2
+
+        # Streaming yields the same questions in the same order
+        assert [q.question_id for q in repo.iter_questions()] == [
+            q.question_id for q in all_questions
+        ]
+        assert len(list(repo.iter_questions(source_id=source1.source_id))) == 3
+
     def test_get_source_by_name(self, repo: QuestionRepository) -> None:
         """Test retrieving a source by name."""
         source = repo.get_or_create_source("MKSAP")
@@ -739,3 +752,11 @@ class TestPersistenceHardening:
             conn1.close()
             session2.close()
 
+
+def test_get_engine_is_shared_per_url(tmp_path: Path) -> None:
+    """Test that get_engine returns one engine per database URL."""
+    url_a = f"sqlite:///{tmp_path / 'a.db'}"
+    url_b = f"sqlite:///{tmp_path / 'b.db'}"
+
+    assert get_engine(url_a) is get_engine(url_a)
+    assert get_engine(url_a) is not get_engine(url_b)